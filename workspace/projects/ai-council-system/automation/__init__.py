@@ -10,64 +10,75 @@ Phase: 5 - Automation & Scale COMPLETE
 Version: 2.0.0
 """
 
-# Scheduler
-from .scheduler import (
-    ScheduleType,
-    DebateStatus,
-    ScheduleConfig,
-    ScheduledDebate,
-    DebateScheduler,
-    EventTriggeredScheduler
-)
+import importlib
 
-# Streaming
-from .streaming import (
-    StreamPlatform,
-    StreamStatus,
-    StreamQuality,
-    StreamConfig,
-    StreamMetrics,
-    StreamDestination,
-    MultiPlatformStreamer,
-    AdaptiveBitrateManager,
-    StreamRecorder
-)
+# Public names are resolved from their submodule on first access (PEP 562),
+# so importing the package does not pull in every subsystem.
+_LAZY_IMPORTS = {
+    # Scheduler
+    "ScheduleType": "scheduler",
+    "DebateStatus": "scheduler",
+    "ScheduleConfig": "scheduler",
+    "ScheduledDebate": "scheduler",
+    "DebateScheduler": "scheduler",
+    "EventTriggeredScheduler": "scheduler",
 
-# Monitoring
-from .monitoring import (
-    HealthStatus,
-    AlertSeverity,
-    HealthCheck,
-    Alert,
-    HealthMonitor,
-    check_scheduler_health,
-    check_streaming_health,
-    check_database_health,
-    check_disk_space,
-    check_memory_usage,
-    check_api_endpoints,
-    check_event_ingestion,
-    check_tts_availability
-)
+    # Streaming
+    "StreamPlatform": "streaming",
+    "StreamStatus": "streaming",
+    "StreamQuality": "streaming",
+    "StreamConfig": "streaming",
+    "StreamMetrics": "streaming",
+    "StreamDestination": "streaming",
+    "MultiPlatformStreamer": "streaming",
+    "AdaptiveBitrateManager": "streaming",
+    "StreamRecorder": "streaming",
 
-# Analytics
-from .analytics import (
-    DebateMetrics,
-    StreamingMetrics,
-    SystemMetrics,
-    AnalyticsDashboard
-)
+    # Monitoring
+    "HealthStatus": "monitoring",
+    "AlertSeverity": "monitoring",
+    "HealthCheck": "monitoring",
+    "Alert": "monitoring",
+    "HealthMonitor": "monitoring",
+    "check_scheduler_health": "monitoring",
+    "check_streaming_health": "monitoring",
+    "check_database_health": "monitoring",
+    "check_disk_space": "monitoring",
+    "check_memory_usage": "monitoring",
+    "check_api_endpoints": "monitoring",
+    "check_event_ingestion": "monitoring",
+    "check_tts_availability": "monitoring",
 
-# Orchestrator
-from .orchestrator import (
-    OrchestratorMode,
-    SystemState,
-    OrchestratorConfig,
-    OrchestratorStats,
-    AutomationOrchestrator
-)
+    # Analytics
+    "DebateMetrics": "analytics",
+    "StreamingMetrics": "analytics",
+    "SystemMetrics": "analytics",
+    "AnalyticsDashboard": "analytics",
 
-__all__ = [
+    # Orchestrator
+    "OrchestratorMode": "orchestrator",
+    "SystemState": "orchestrator",
+    "OrchestratorConfig": "orchestrator",
+    "OrchestratorStats": "orchestrator",
+    "AutomationOrchestrator": "orchestrator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
+
+
+__all__ = (
     # Scheduler
     "ScheduleType",
     "DebateStatus",
@@ -114,6 +125,6 @@ __all__ = [
     "OrchestratorConfig",
     "OrchestratorStats",
     "AutomationOrchestrator",
-]
+)
 
 __version__ = "2.0.0"
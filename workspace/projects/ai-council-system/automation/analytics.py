@@ -9,14 +9,44 @@ Phase: 5.1 - Automation & Scale
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
-from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Optional, Any, Set, Tuple
+from collections import Counter, deque
+from functools import wraps
+from operator import attrgetter
+import asyncio
 import json
+import logging
+import math
+import time
 from pathlib import Path
 
+import numpy as np
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one compact JSONL line"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
+
+def _append_lines(buffer: Dict[Path, List[bytes]]):
+    """Append buffered JSONL lines to their files"""
+    for file_path, lines in buffer.items():
+        with open(file_path, 'ab') as f:
+            f.writelines(lines)
+
+
+@dataclass(slots=True)
 class DebateMetrics:
     """Metrics for a single debate"""
     debate_id: str
@@ -54,7 +84,7 @@ class DebateMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamingMetrics:
     """Streaming performance metrics"""
     session_id: str
@@ -82,7 +112,7 @@ class StreamingMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """Overall system performance metrics"""
     timestamp: datetime
@@ -108,6 +138,169 @@ class SystemMetrics:
         }
 
 
+class _ColumnStore:
+    """
+    Growable structure-of-arrays mirror of a metrics list.
+
+    Holds the numeric fields as rows of one 2-D float64 block so aggregations
+    run as NumPy reductions instead of Python loops over dataclass attributes,
+    and all column sums over a window come from a single reduction. Entries
+    are kept sorted by their "start_ts" column (with the original metrics
+    objects alongside in `rows`), so a time window is a contiguous slice
+    found by binary search.
+    """
+
+    def __init__(self, names: List[str], capacity: int = 64):
+        self.size = 0
+        self.rows: List[Any] = []
+        self.index = {name: i for i, name in enumerate(names)}
+        self._data = np.zeros((len(names), capacity))
+
+    def append(self, row: Any, values: Tuple[float, ...]) -> int:
+        """
+        Insert one entry in start_ts order, doubling capacity when full
+
+        `values` holds one value per column, in column order. Returns the
+        entry's index.
+        """
+        data = self._data
+        if self.size == data.shape[1]:
+            grown = np.zeros((data.shape[0], data.shape[1] * 2))
+            grown[:, :self.size] = data
+            data = self._data = grown
+
+        # Entries normally arrive in time order; only late arrivals shift the tail
+        pos = int(np.searchsorted(self["start_ts"], values[self.index["start_ts"]], side="right"))
+        if pos < self.size:
+            data[:, pos + 1:self.size + 1] = data[:, pos:self.size]
+        data[:, pos] = values
+        self.rows.insert(pos, row)
+        self.size += 1
+        return pos
+
+    def since(self, cutoff_ts: float) -> int:
+        """Index of the first entry with start_ts >= cutoff_ts"""
+        return int(np.searchsorted(self["start_ts"], cutoff_ts, side="left"))
+
+    def sums(self, start: int) -> np.ndarray:
+        """Per-column sums over entries [start:], in one reduction"""
+        return self._data[:, start:self.size].sum(axis=1)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """View of the filled part of a column"""
+        return self._data[self.index[name], :self.size]
+
+
+# Metric attributes mirrored into the column stores, in column order
+_DEBATE_FIELDS = (
+    "duration_seconds", "participant_count", "round_count", "engagement_score",
+    "controversy_score", "consensus_level", "viewer_count_peak"
+)
+_STREAMING_FIELDS = ("total_viewers_peak", "avg_bitrate_kbps", "uptime_percent")
+_debate_field_values = attrgetter(*_DEBATE_FIELDS)
+_streaming_field_values = attrgetter(*_STREAMING_FIELDS)
+
+
+class _RollingWindow:
+    """
+    Running sums and maxima over the most recent `size` samples.
+
+    Each sample carries a tuple of numeric values. Sums are updated as samples
+    enter and leave, and re-summed exactly once per `size` evictions so float
+    drift cannot build up. Maxima for the `peak_fields` use monotonic deques
+    (sliding-window maximum), so every operation is amortised O(1).
+    """
+
+    def __init__(self, width: int, size: int = 100, peak_fields: tuple = ()):
+        self.size = size
+        self.samples: deque = deque()  # (seq, row, values)
+        self.sums = [0.0] * width
+        self._peaks = {i: deque() for i in peak_fields}  # (seq, value), values decreasing
+        self._next_seq = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def push(self, row: Any, values: tuple):
+        """Add the newest sample, evicting the oldest when full"""
+        if len(self.samples) == self.size:
+            self.pop_oldest()
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self.samples.append((seq, row, values))
+
+        sums = self.sums
+        for i, value in enumerate(values):
+            sums[i] += value
+        for i, peaks in self._peaks.items():
+            value = values[i]
+            while peaks and peaks[-1][1] <= value:
+                peaks.pop()
+            peaks.append((seq, value))
+
+    def pop_oldest(self):
+        """Drop the oldest sample"""
+        seq, _, values = self.samples.popleft()
+
+        sums = self.sums
+        for i, value in enumerate(values):
+            sums[i] -= value
+        for peaks in self._peaks.values():
+            if peaks[0][0] == seq:
+                peaks.popleft()
+
+        self._evictions += 1
+        if self._evictions >= self.size:
+            self._evictions = 0
+            self.sums = [math.fsum(sample[2][i] for sample in self.samples) for i in range(len(sums))]
+
+    def peak(self, field_index: int) -> float:
+        """Maximum of a peak field over the window"""
+        return self._peaks[field_index][0][1]
+
+    def newest(self) -> Any:
+        """Row of the most recent sample"""
+        return self.samples[-1][1]
+
+
+# Buffered metric lines are written once this many are pending, or after
+# this many seconds when running inside an event loop
+_WRITE_BATCH_SIZE = 100
+_WRITE_FLUSH_SECONDS = 5.0
+
+# Seconds a memoized statistics result may be served before it is recomputed
+_STATS_CACHE_TTL = 300
+
+
+def _memoized(method):
+    """
+    Cache a statistics getter until new metrics are recorded
+
+    Results are keyed by call arguments and are reused while the dashboard's
+    data version and the current TTL bucket are unchanged, so callers must
+    treat them as read-only.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        stamp = (self._version, int(time.time() // _STATS_CACHE_TTL))
+        if stamp != self._cache_stamp:
+            self._cache.clear()
+            self._cache_stamp = stamp
+
+        key = (name, args, tuple(sorted(kwargs.items())))
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = method(self, *args, **kwargs)
+            return result
+
+    return wrapper
+
+
 class AnalyticsDashboard:
     """
     Analytics and metrics tracking system
@@ -121,32 +314,70 @@ class AnalyticsDashboard:
     - Real-time dashboards
     """
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, system_sample_seconds: float = 60):
         """
         Initialize analytics dashboard
 
         Args:
             data_dir: Directory for storing analytics data
+            system_sample_seconds: Expected interval between system samples,
+                used to size the 24 hour system metrics buffer
         """
-        self.data_dir = data_dir
-        if data_dir:
-            self.data_dir = Path(data_dir)
+        self.data_dir = Path(data_dir) if data_dir else None
+        if self.data_dir:
             self.data_dir.mkdir(parents=True, exist_ok=True)
+        # Daily JSONL paths keyed by (kind, date_str)
+        self._path_cache: Dict[tuple, Path] = {}
 
         # Metrics storage
         self.debate_metrics: List[DebateMetrics] = []
         self.streaming_metrics: List[StreamingMetrics] = []
-        self.system_metrics: List[SystemMetrics] = []
+        self.system_metrics: deque = deque(maxlen=max(1, int(86400 / system_sample_seconds)))
+        # Last 100 system samples (a suffix of system_metrics) with running
+        # sums of cpu, memory, disk, network in/out and peaks of cpu and memory
+        self._system_window = _RollingWindow(
+            5, size=min(100, self.system_metrics.maxlen), peak_fields=(0, 1)
+        )
+
+        # Columnar copies of the numeric fields used by the statistics getters
+        self._debate_columns = _ColumnStore(["start_ts", *_DEBATE_FIELDS, "day"])
+        # Significant topic words per debate, parallel to _debate_columns.rows
+        self._debate_keywords: List[List[str]] = []
+        self._streaming_columns = _ColumnStore(["start_ts", "duration_hours", *_STREAMING_FIELDS])
 
         # Aggregated statistics
         self.total_debates = 0
         self.total_stream_time_hours = 0.0
         self.total_viewers_all_time = 0
 
+        # Pending JSONL lines per file, written out by flush() or, inside an
+        # event loop, by background writes in a worker thread
+        self._write_buffer: Dict[Path, List[bytes]] = {}
+        self._pending_writes = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Background writes still running; the lock keeps them in order
+        self._write_tasks: Set[asyncio.Task] = set()
+        self._write_lock = asyncio.Lock()
+
+        # Memoized statistics, invalidated whenever _version changes
+        self._version = 0
+        self._cache: Dict[tuple, Any] = {}
+        self._cache_stamp: Optional[tuple] = None
+
     def record_debate(self, metrics: DebateMetrics):
         """Record debate metrics"""
         self.debate_metrics.append(metrics)
+        pos = self._debate_columns.append(metrics, (
+            metrics.start_time.timestamp(),
+            *_debate_field_values(metrics),
+            metrics.start_time.toordinal()
+        ))
+        # Extract keywords from topic once (simplified: only significant words)
+        self._debate_keywords.insert(
+            pos, [word for word in metrics.topic.lower().split() if len(word) > 4]
+        )
         self.total_debates += 1
+        self._version += 1
 
         # Save to disk if configured
         if self.data_dir:
@@ -156,25 +387,56 @@ class AnalyticsDashboard:
         """Record streaming metrics"""
         self.streaming_metrics.append(metrics)
 
+        duration_hours = 0.0
         if metrics.end_time and metrics.start_time:
             duration_hours = (metrics.end_time - metrics.start_time).total_seconds() / 3600
             self.total_stream_time_hours += duration_hours
 
+        self._streaming_columns.append(metrics, (
+            metrics.start_time.timestamp(),
+            duration_hours,
+            *_streaming_field_values(metrics)
+        ))
+        self._version += 1
+
         # Save to disk if configured
         if self.data_dir:
             self._save_streaming_metrics(metrics)
 
+    def record_batch(self, items: List[Any]):
+        """Record a batch of debate and streaming metrics in order"""
+        for metrics in items:
+            if isinstance(metrics, DebateMetrics):
+                self.record_debate(metrics)
+            elif isinstance(metrics, StreamingMetrics):
+                self.record_streaming(metrics)
+            else:
+                raise TypeError(f"Unsupported metrics type: {type(metrics).__name__}")
+
     def record_system(self, metrics: SystemMetrics):
         """Record system metrics"""
-        self.system_metrics.append(metrics)
+        self._version += 1
 
-        # Keep only recent system metrics (last 24 hours)
+        # Keep only recent system metrics (last 24 hours); samples arrive in
+        # time order, so expired ones are always at the left end
         cutoff = datetime.now() - timedelta(hours=24)
-        self.system_metrics = [
-            m for m in self.system_metrics
-            if m.timestamp >= cutoff
-        ]
+        system_metrics = self.system_metrics
+        window = self._system_window
+        if metrics.timestamp >= cutoff:
+            system_metrics.append(metrics)
+            window.push(metrics, (
+                metrics.cpu_usage_percent,
+                metrics.memory_usage_percent,
+                metrics.disk_usage_percent,
+                metrics.network_in_mbps,
+                metrics.network_out_mbps
+            ))
+        while system_metrics and system_metrics[0].timestamp < cutoff:
+            system_metrics.popleft()
+            if len(window) > len(system_metrics):
+                window.pop_oldest()
 
+    @_memoized
     def get_debate_statistics(self, days: int = 7) -> Dict[str, Any]:
         """
         Get debate statistics for the last N days
@@ -185,13 +447,11 @@ class AnalyticsDashboard:
         Returns:
             Statistics dictionary
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_debates = [
-            d for d in self.debate_metrics
-            if d.start_time >= cutoff
-        ]
+        columns = self._debate_columns
+        start = columns.since(time.time() - days * 86400)
+        count = columns.size - start
 
-        if not recent_debates:
+        if not count:
             return {
                 "total_debates": 0,
                 "avg_duration_minutes": 0.0,
@@ -199,122 +459,112 @@ class AnalyticsDashboard:
                 "avg_engagement": 0.0
             }
 
+        sums = columns.sums(start)
+        col = columns.index
+
         return {
-            "total_debates": len(recent_debates),
-            "avg_duration_minutes": sum(d.duration_seconds for d in recent_debates) / len(recent_debates) / 60,
-            "avg_participants": sum(d.participant_count for d in recent_debates) / len(recent_debates),
-            "avg_rounds": sum(d.round_count for d in recent_debates) / len(recent_debates),
-            "avg_engagement": sum(d.engagement_score for d in recent_debates) / len(recent_debates),
-            "avg_controversy": sum(d.controversy_score for d in recent_debates) / len(recent_debates),
-            "avg_consensus": sum(d.consensus_level for d in recent_debates) / len(recent_debates),
-            "peak_viewers": max((d.viewer_count_peak for d in recent_debates), default=0),
-            "debates_per_day": len(recent_debates) / days
+            "total_debates": count,
+            "avg_duration_minutes": float(sums[col["duration_seconds"]]) / count / 60,
+            "avg_participants": float(sums[col["participant_count"]]) / count,
+            "avg_rounds": float(sums[col["round_count"]]) / count,
+            "avg_engagement": float(sums[col["engagement_score"]]) / count,
+            "avg_controversy": float(sums[col["controversy_score"]]) / count,
+            "avg_consensus": float(sums[col["consensus_level"]]) / count,
+            "peak_viewers": int(columns["viewer_count_peak"][start:].max(initial=0)),
+            "debates_per_day": count / days
         }
 
+    @_memoized
     def get_streaming_statistics(self, days: int = 7) -> Dict[str, Any]:
         """Get streaming statistics"""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_streams = [
-            s for s in self.streaming_metrics
-            if s.start_time >= cutoff
-        ]
+        columns = self._streaming_columns
+        start = columns.since(time.time() - days * 86400)
+        count = columns.size - start
 
-        if not recent_streams:
+        if not count:
             return {
                 "total_streams": 0,
                 "total_hours": 0.0,
                 "avg_viewers": 0
             }
 
-        total_hours = sum(
-            (s.end_time - s.start_time).total_seconds() / 3600
-            for s in recent_streams
-            if s.end_time
-        )
+        sums = columns.sums(start)
+        col = columns.index
 
         return {
-            "total_streams": len(recent_streams),
-            "total_hours": total_hours,
-            "avg_viewers": sum(s.total_viewers_peak for s in recent_streams) / len(recent_streams),
-            "total_viewers_peak": max((s.total_viewers_peak for s in recent_streams), default=0),
-            "avg_bitrate": sum(s.avg_bitrate_kbps for s in recent_streams) / len(recent_streams),
-            "avg_uptime": sum(s.uptime_percent for s in recent_streams) / len(recent_streams),
+            "total_streams": count,
+            "total_hours": float(sums[col["duration_hours"]]),
+            "avg_viewers": float(sums[col["total_viewers_peak"]]) / count,
+            "total_viewers_peak": int(columns["total_viewers_peak"][start:].max(initial=0)),
+            "avg_bitrate": float(sums[col["avg_bitrate_kbps"]]) / count,
+            "avg_uptime": float(sums[col["uptime_percent"]]) / count,
             "platforms_used": list(set(
                 platform
-                for stream in recent_streams
+                for stream in columns.rows[start:]
                 for platform in stream.platforms
             ))
         }
 
     def get_system_statistics(self) -> Dict[str, Any]:
         """Get current system statistics"""
-        if not self.system_metrics:
+        window = self._system_window  # Last 100 samples
+        if not window:
             return {
                 "avg_cpu": 0.0,
                 "avg_memory": 0.0,
                 "avg_disk": 0.0
             }
 
-        recent = self.system_metrics[-100:]  # Last 100 samples
+        count = len(window)
+        cpu, memory, disk, network_in, network_out = window.sums
+        latest = window.newest()
 
         return {
-            "avg_cpu": sum(m.cpu_usage_percent for m in recent) / len(recent),
-            "avg_memory": sum(m.memory_usage_percent for m in recent) / len(recent),
-            "avg_disk": sum(m.disk_usage_percent for m in recent) / len(recent),
-            "avg_network_in": sum(m.network_in_mbps for m in recent) / len(recent),
-            "avg_network_out": sum(m.network_out_mbps for m in recent) / len(recent),
-            "peak_cpu": max((m.cpu_usage_percent for m in recent), default=0.0),
-            "peak_memory": max((m.memory_usage_percent for m in recent), default=0.0),
-            "current_active_debates": recent[-1].active_debates if recent else 0,
-            "current_active_streams": recent[-1].active_streams if recent else 0
+            "avg_cpu": cpu / count,
+            "avg_memory": memory / count,
+            "avg_disk": disk / count,
+            "avg_network_in": network_in / count,
+            "avg_network_out": network_out / count,
+            "peak_cpu": window.peak(0),
+            "peak_memory": window.peak(1),
+            "current_active_debates": latest.active_debates,
+            "current_active_streams": latest.active_streams
         }
 
+    @_memoized
     def get_topic_trends(self, days: int = 30) -> Dict[str, int]:
         """Get trending debate topics"""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_debates = [
-            d for d in self.debate_metrics
-            if d.start_time >= cutoff and d.topic
-        ]
+        start = self._debate_columns.since(time.time() - days * 86400)
 
-        topic_counts = defaultdict(int)
-        for debate in recent_debates:
-            # Extract keywords from topic (simplified)
-            words = debate.topic.lower().split()
-            for word in words:
-                if len(word) > 4:  # Only count significant words
-                    topic_counts[word] += 1
+        topic_counts = Counter()
+        for words in self._debate_keywords[start:]:
+            topic_counts.update(words)
 
         # Return top 10
-        sorted_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)
-        return dict(sorted_topics[:10])
+        return dict(topic_counts.most_common(10))
 
+    @_memoized
     def get_engagement_trends(self, days: int = 7) -> List[Dict]:
         """Get engagement trends over time"""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_debates = [
-            d for d in self.debate_metrics
-            if d.start_time >= cutoff
+        columns = self._debate_columns
+        start = columns.since(time.time() - days * 86400)
+        if start == columns.size:
+            return []
+
+        # Group by day (ordinal dates, returned sorted) and average per group
+        day_ordinals, day_index = np.unique(columns["day"][start:], return_inverse=True)
+        counts = np.bincount(day_index)
+        sums = np.bincount(day_index, weights=columns["engagement_score"][start:])
+
+        return [
+            {
+                "date": date.fromordinal(int(day)).isoformat(),
+                "avg_engagement": float(total) / int(count),
+                "debate_count": int(count)
+            }
+            for day, total, count in zip(day_ordinals, sums, counts)
         ]
 
-        # Group by day
-        daily_engagement = defaultdict(list)
-        for debate in recent_debates:
-            day = debate.start_time.date()
-            daily_engagement[day].append(debate.engagement_score)
-
-        # Calculate daily averages
-        trends = []
-        for day in sorted(daily_engagement.keys()):
-            scores = daily_engagement[day]
-            trends.append({
-                "date": day.isoformat(),
-                "avg_engagement": sum(scores) / len(scores),
-                "debate_count": len(scores)
-            })
-
-        return trends
-
     def get_performance_insights(self) -> Dict[str, Any]:
         """Generate performance insights and recommendations"""
         debate_stats = self.get_debate_statistics(days=7)
@@ -377,22 +627,79 @@ class AnalyticsDashboard:
         if not self.data_dir:
             return
 
-        date_str = metrics.start_time.strftime("%Y%m%d")
-        file_path = self.data_dir / f"debates_{date_str}.jsonl"
-
-        with open(file_path, 'a') as f:
-            f.write(json.dumps(metrics.to_dict()) + "\n")
+        file_path = self._daily_path("debates", metrics.start_time)
+        self._buffer_write(file_path, _dumps_line(metrics.to_dict()))
 
     def _save_streaming_metrics(self, metrics: StreamingMetrics):
         """Save streaming metrics to file"""
         if not self.data_dir:
             return
 
-        date_str = metrics.start_time.strftime("%Y%m%d")
-        file_path = self.data_dir / f"streaming_{date_str}.jsonl"
+        file_path = self._daily_path("streaming", metrics.start_time)
+        self._buffer_write(file_path, _dumps_line(metrics.to_dict()))
+
+    def _daily_path(self, kind: str, moment: datetime) -> Path:
+        """Get the JSONL file for records of this kind on moment's day"""
+        key = (kind, moment.strftime("%Y%m%d"))
+        file_path = self._path_cache.get(key)
+        if file_path is None:
+            file_path = self._path_cache[key] = self.data_dir / f"{kind}_{key[1]}.jsonl"
+        return file_path
+
+    def _buffer_write(self, file_path: Path, line: bytes):
+        """Queue a line for file_path, flushing by batch size or timer"""
+        self._write_buffer.setdefault(file_path, []).append(line)
+        self._pending_writes += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to write in the background, so write through
+            self.flush()
+            return
+
+        if self._pending_writes >= _WRITE_BATCH_SIZE:
+            self._flush_in_background()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(_WRITE_FLUSH_SECONDS, self._flush_in_background)
+
+    def _take_buffer(self) -> Dict[Path, List[bytes]]:
+        """Detach the pending lines and cancel the flush timer"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        buffer, self._write_buffer = self._write_buffer, {}
+        self._pending_writes = 0
+        return buffer
+
+    def _flush_in_background(self):
+        """Hand the pending lines to a worker thread without blocking the loop"""
+        buffer = self._take_buffer()
+        if not buffer:
+            return
+
+        task = asyncio.create_task(self._write_buffered(buffer))
+        self._write_tasks.add(task)
+        task.add_done_callback(self._write_tasks.discard)
+
+    async def _write_buffered(self, buffer: Dict[Path, List[bytes]]):
+        """Write one detached buffer, after any earlier background writes"""
+        async with self._write_lock:
+            try:
+                await asyncio.to_thread(_append_lines, buffer)
+            except OSError as e:
+                logger.error("Failed to write analytics metrics: %s", e)
+
+    def flush(self):
+        """Write all buffered metrics to disk, blocking until done"""
+        _append_lines(self._take_buffer())
 
-        with open(file_path, 'a') as f:
-            f.write(json.dumps(metrics.to_dict()) + "\n")
+    async def aclose(self):
+        """Write out buffered metrics and wait for all background writes; call before shutdown"""
+        self._flush_in_background()
+        if self._write_tasks:
+            await asyncio.gather(*self._write_tasks)
 
     def export_report(self, output_path: Path, days: int = 30):
         """
@@ -413,7 +720,11 @@ class AnalyticsDashboard:
             "insights": self.get_performance_insights()
         }
 
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(report, f, indent=2)
 
         print(f"📊 Analytics report exported to: {output_path}")
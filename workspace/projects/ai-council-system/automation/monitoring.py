@@ -12,7 +12,12 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import List, Dict, Optional, Callable, Any
+from collections import deque
+from functools import lru_cache
 import asyncio
+import itertools
+import shutil
+import time
 
 
 class HealthStatus(Enum):
@@ -31,7 +36,25 @@ class AlertSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Ordering used to pick the worst status across checks
+_STATUS_RANK = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.UNHEALTHY: 2,
+    HealthStatus.CRITICAL: 3,
+}
+
+# Alerts waiting for the on_alert callback; further alerts are dropped
+_ALERT_QUEUE_SIZE = 1000
+
+
+@lru_cache(maxsize=1024)
+def _isoformat(moment: datetime) -> str:
+    """isoformat() for timestamps that are serialized on every dashboard render"""
+    return moment.isoformat()
+
+
+@dataclass(slots=True)
 class HealthCheck:
     """Individual health check"""
     name: str
@@ -46,7 +69,7 @@ class HealthCheck:
         return self.status == HealthStatus.HEALTHY
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """System alert"""
     alert_id: str
@@ -64,9 +87,9 @@ class Alert:
             "severity": self.severity.value,
             "component": self.component,
             "message": self.message,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _isoformat(self.timestamp),
             "resolved": self.resolved,
-            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None
+            "resolved_at": _isoformat(self.resolved_at) if self.resolved_at else None
         }
 
 
@@ -91,34 +114,58 @@ class HealthMonitor:
         """
         self.check_interval = check_interval_seconds
         self.checks: Dict[str, HealthCheck] = {}
+        self._check_fns: Dict[str, Callable] = {}
+        self._check_intervals: Dict[str, float] = {}
+        # Long-lived per-check loops, running while monitoring
+        self._check_tasks: Dict[str, asyncio.Task] = {}
+        self._stop_event: Optional[asyncio.Event] = None
         self.alerts: List[Alert] = []
+        self._recent_alerts: deque = deque(maxlen=10)
+        # Unresolved alerts by ID, in creation order
+        self._active_alerts: Dict[str, Alert] = {}
         self.monitoring = False
 
         # Callbacks
         self.on_alert: Optional[Callable] = None
         self.on_health_change: Optional[Callable] = None
 
+        # Alert delivery: one worker drains a bounded queue into on_alert
+        self._alert_queue: Optional[asyncio.Queue] = None
+        self._alert_worker: Optional[asyncio.Task] = None
+        self._alert_ids = itertools.count(1)
+
         # Statistics
         self.total_checks = 0
         self.total_alerts = 0
+        self.dropped_alerts = 0
         self.uptime_start: Optional[datetime] = None
 
-    def register_check(self, name: str, check_fn: Callable) -> None:
+    def register_check(
+        self,
+        name: str,
+        check_fn: Callable,
+        interval_seconds: Optional[float] = None
+    ) -> None:
         """
         Register a health check function
 
         Args:
             name: Check name
             check_fn: Async function that returns (bool, str) for (healthy, message)
+            interval_seconds: How often to run this check while monitoring
+                (defaults to the monitor's check interval)
         """
         self.checks[name] = HealthCheck(
             name=name,
             status=HealthStatus.HEALTHY,
             last_check=datetime.now()
         )
+        self._check_fns[name] = check_fn
+        self._check_intervals[name] = interval_seconds or self.check_interval
 
-        # Store function reference in metadata
-        self.checks[name].metadata["check_fn"] = check_fn
+        # Checks added while monitoring start right away
+        if self.monitoring and self._stop_event is not None:
+            self._start_check_loop(name)
 
     async def run_check(self, name: str) -> HealthCheck:
         """
@@ -134,13 +181,13 @@ class HealthMonitor:
         if not check:
             raise ValueError(f"Check '{name}' not registered")
 
-        check_fn = check.metadata.get("check_fn")
+        check_fn = self._check_fns.get(name)
         if not check_fn:
             check.status = HealthStatus.UNHEALTHY
             check.message = "No check function configured"
             return check
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
             # Run check
@@ -149,8 +196,8 @@ class HealthMonitor:
             # Update check
             check.status = HealthStatus.HEALTHY if is_healthy else HealthStatus.UNHEALTHY
             check.message = message
+            check.response_time_ms = (time.perf_counter() - start_time) * 1000
             check.last_check = datetime.now()
-            check.response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
             # Generate alert if unhealthy
             if not is_healthy:
@@ -185,82 +232,131 @@ class HealthMonitor:
 
         return self.checks
 
-    def _create_alert(self, severity: AlertSeverity, component: str, message: str):
+    def raise_alert(self, severity: AlertSeverity, component: str, message: str) -> Alert:
+        """Raise an alert on behalf of another component"""
+        return self._create_alert(severity, component, message)
+
+    def _create_alert(self, severity: AlertSeverity, component: str, message: str) -> Alert:
         """Create a new alert"""
-        alert_id = f"alert_{int(datetime.now().timestamp())}"
+        now = datetime.now()
+        alert_id = f"alert_{int(now.timestamp())}_{next(self._alert_ids)}"
 
         alert = Alert(
             alert_id=alert_id,
             severity=severity,
             component=component,
             message=message,
-            timestamp=datetime.now()
+            timestamp=now
         )
 
         self.alerts.append(alert)
+        self._recent_alerts.append(alert)
+        self._active_alerts[alert_id] = alert
         self.total_alerts += 1
 
-        # Call alert callback
+        # Queue for the alert callback
         if self.on_alert:
-            asyncio.create_task(self.on_alert(alert))
+            self._enqueue_alert(alert)
 
         print(f"🚨 ALERT [{severity.value.upper()}] {component}: {message}")
+        return alert
+
+    def _enqueue_alert(self, alert: Alert):
+        """Hand an alert to the delivery worker, starting it if needed"""
+        if self._alert_worker is None or self._alert_worker.done():
+            self._alert_queue = asyncio.Queue(maxsize=_ALERT_QUEUE_SIZE)
+            self._alert_worker = asyncio.create_task(self._drain_alerts(self._alert_queue))
+
+        try:
+            self._alert_queue.put_nowait(alert)
+        except asyncio.QueueFull:
+            self.dropped_alerts += 1
+
+    async def _drain_alerts(self, queue: asyncio.Queue):
+        """Deliver queued alerts to on_alert one at a time"""
+        while True:
+            alert = await queue.get()
+            if self.on_alert:
+                try:
+                    await self.on_alert(alert)
+                except Exception as e:
+                    print(f"⚠️  Alert callback failed for {alert.alert_id}: {e}")
 
     def resolve_alert(self, alert_id: str):
         """Mark an alert as resolved"""
-        for alert in self.alerts:
-            if alert.alert_id == alert_id and not alert.resolved:
-                alert.resolved = True
-                alert.resolved_at = datetime.now()
-                return True
-        return False
+        alert = self._active_alerts.pop(alert_id, None)
+        if alert is None:
+            return False
+
+        alert.resolved = True
+        alert.resolved_at = datetime.now()
+        return True
 
     def get_overall_status(self) -> HealthStatus:
         """Get overall system health status"""
-        if not self.checks:
-            return HealthStatus.HEALTHY
-
-        statuses = [check.status for check in self.checks.values()]
-
-        # Critical if any check is critical
-        if HealthStatus.CRITICAL in statuses:
-            return HealthStatus.CRITICAL
-
-        # Unhealthy if any check is unhealthy
-        if HealthStatus.UNHEALTHY in statuses:
-            return HealthStatus.UNHEALTHY
-
-        # Degraded if any check is degraded
-        if HealthStatus.DEGRADED in statuses:
-            return HealthStatus.DEGRADED
-
-        return HealthStatus.HEALTHY
+        # Overall status is the worst individual status; nothing beats critical
+        worst = HealthStatus.HEALTHY
+        worst_rank = 0
+        for check in self.checks.values():
+            rank = _STATUS_RANK[check.status]
+            if rank > worst_rank:
+                worst, worst_rank = check.status, rank
+                if worst is HealthStatus.CRITICAL:
+                    break
+
+        return worst
 
     def get_active_alerts(self) -> List[Alert]:
         """Get all unresolved alerts"""
-        return [alert for alert in self.alerts if not alert.resolved]
+        return list(self._active_alerts.values())
 
     def get_alerts_by_severity(self, severity: AlertSeverity) -> List[Alert]:
         """Get alerts by severity"""
         return [
-            alert for alert in self.alerts
-            if alert.severity == severity and not alert.resolved
+            alert for alert in self._active_alerts.values()
+            if alert.severity == severity
         ]
 
+    def _start_check_loop(self, name: str):
+        """Start (or restart) the loop for one check"""
+        task = self._check_tasks.get(name)
+        if task:
+            task.cancel()
+        self._check_tasks[name] = asyncio.create_task(self._check_loop(name))
+
+    async def _check_loop(self, name: str):
+        """Run one check on its own interval until monitoring stops"""
+        while self.monitoring and name in self.checks:
+            await self.run_check(name)
+            await asyncio.sleep(self._check_intervals[name])
+
     async def start_monitoring(self):
         """Start continuous health monitoring"""
         self.monitoring = True
         self.uptime_start = datetime.now()
+        self._stop_event = asyncio.Event()
 
         print(f"💚 Health monitoring started (interval: {self.check_interval}s)")
 
-        while self.monitoring:
-            await self.run_all_checks()
-            await asyncio.sleep(self.check_interval)
+        for name in self.checks:
+            self._start_check_loop(name)
+
+        try:
+            await self._stop_event.wait()
+        finally:
+            for task in self._check_tasks.values():
+                task.cancel()
+            self._check_tasks.clear()
+            self._stop_event = None
 
     def stop_monitoring(self):
         """Stop health monitoring"""
         self.monitoring = False
+        if self._stop_event:
+            self._stop_event.set()
+        if self._alert_worker:
+            self._alert_worker.cancel()
+            self._alert_worker = None
         print("🛑 Health monitoring stopped")
 
     def get_uptime_seconds(self) -> float:
@@ -278,20 +374,21 @@ class HealthMonitor:
             "uptime_hours": self.get_uptime_seconds() / 3600,
             "total_checks": self.total_checks,
             "total_alerts": self.total_alerts,
+            "dropped_alerts": self.dropped_alerts,
             "active_alerts": len(active_alerts),
             "critical_alerts": len(self.get_alerts_by_severity(AlertSeverity.CRITICAL)),
             "checks": {
                 name: {
                     "status": check.status.value,
                     "message": check.message,
-                    "last_check": check.last_check.isoformat(),
+                    "last_check": _isoformat(check.last_check),
                     "response_time_ms": check.response_time_ms
                 }
                 for name, check in self.checks.items()
             },
             "recent_alerts": [
                 alert.to_dict()
-                for alert in self.alerts[-10:]  # Last 10 alerts
+                for alert in self._recent_alerts  # Last 10 alerts
             ]
         }
 
@@ -319,7 +416,6 @@ async def check_database_health() -> tuple[bool, str]:
 async def check_disk_space() -> tuple[bool, str]:
     """Check available disk space"""
     # In production, check actual disk usage
-    import shutil
     try:
         usage = shutil.disk_usage("/")
         free_percent = (usage.free / usage.total) * 100
@@ -15,16 +15,20 @@ Phase: 5 - Automation & Scale Complete
 """
 
 import asyncio
+import functools
+from collections import deque
 import logging
+import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, Callable, List
+from typing import Optional, Dict, Any, Callable, List, Literal, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
 from .scheduler import DebateScheduler, ScheduleConfig, ScheduleType, DebateStatus
 from .streaming import MultiPlatformStreamer, StreamConfig, StreamPlatform, StreamQuality
-from .monitoring import HealthMonitor, HealthStatus, AlertSeverity
+from .monitoring import HealthMonitor, HealthStatus, Alert, AlertSeverity
 from .analytics import AnalyticsDashboard, DebateMetrics, StreamingMetrics, SystemMetrics
 
 # Set up logging
@@ -34,6 +38,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Ceiling for the health multiplier; a fully healthy streak doubles the
+# health check interval, any problem drops it back to the base interval
+_HEALTH_MULTIPLIER_MAX = 8
+
+
+async def _to_thread(func: Callable, /, *args, **kwargs) -> Any:
+    """
+    Run a blocking call in the default executor
+
+    Like asyncio.to_thread, but without copying the current context: the
+    orchestrator sets no context variables, so the copy and the extra
+    ctx.run frame are pure overhead.
+    """
+    if kwargs:
+        func = functools.partial(func, *args, **kwargs)
+        args = ()
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
+# Recording scan batch size and end-of-scan marker
+_SCAN_BATCH_SIZE = 256
+_SCAN_DONE = object()
+
+
+def _scan_recordings(
+    recording_path: Path,
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue,
+    batch_size: int = _SCAN_BATCH_SIZE
+):
+    """
+    Producer run in a worker thread: hand (path, mtime) batches of .mp4
+    recordings to the event loop through queue, then _SCAN_DONE
+    """
+    try:
+        batch = []
+        with os.scandir(recording_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".mp4") and entry.is_file(follow_symlinks=False):
+                    batch.append((entry.path, entry.stat(follow_symlinks=False).st_mtime))
+                    if len(batch) >= batch_size:
+                        loop.call_soon_threadsafe(queue.put_nowait, batch)
+                        batch = []
+        if batch:
+            loop.call_soon_threadsafe(queue.put_nowait, batch)
+    finally:
+        loop.call_soon_threadsafe(queue.put_nowait, _SCAN_DONE)
+
+
+def _unlink_files(paths: List[str]) -> int:
+    """Delete files, ignoring ones already gone; returns how many were removed"""
+    removed = 0
+    for path in paths:
+        try:
+            os.unlink(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
 
 class OrchestratorMode(Enum):
     """Operating mode for the orchestrator"""
@@ -42,6 +106,9 @@ class OrchestratorMode(Enum):
     ON_DEMAND = "on_demand"    # Manual trigger only
     TEST = "test"              # Test mode with mock data
 
+    # Enum members are singletons; an identity hash keeps the name and transition tables cheap
+    __hash__ = object.__hash__
+
 
 class SystemState(Enum):
     """Current state of the system"""
@@ -52,8 +119,29 @@ class SystemState(Enum):
     STOPPED = "stopped"
     ERROR = "error"
 
+    __hash__ = object.__hash__
+
+
+# Display names, looked up without going through the Enum value descriptor
+_STATE_NAMES: Dict[SystemState, str] = {state: state.value for state in SystemState}
+_MODE_NAMES: Dict[OrchestratorMode, str] = {mode: mode.value for mode in OrchestratorMode}
+
 
-@dataclass
+# Lifecycle state machine: (current state, event) -> next state
+_TRANSITIONS: Dict[tuple, SystemState] = {
+    (SystemState.INITIALIZING, "initialized"): SystemState.STOPPED,
+    (SystemState.INITIALIZING, "start"): SystemState.RUNNING,
+    (SystemState.STOPPED, "start"): SystemState.RUNNING,
+    (SystemState.ERROR, "start"): SystemState.RUNNING,
+    (SystemState.RUNNING, "pause"): SystemState.PAUSED,
+    (SystemState.PAUSED, "resume"): SystemState.RUNNING,
+    (SystemState.STOPPING, "stopped"): SystemState.STOPPED,
+    **{(state, "stop"): SystemState.STOPPING for state in SystemState},
+    **{(state, "fail"): SystemState.ERROR for state in SystemState},
+}
+
+
+@dataclass(slots=True)
 class OrchestratorConfig:
     """Configuration for the orchestrator"""
     mode: OrchestratorMode = OrchestratorMode.CONTINUOUS
@@ -66,6 +154,7 @@ class OrchestratorConfig:
     enable_streaming: bool = True
     enable_recording: bool = True
     recording_path: Optional[Path] = None
+    recording_retention_days: Optional[int] = None  # None keeps recordings forever
 
     # Monitoring
     enable_health_monitoring: bool = True
@@ -75,6 +164,8 @@ class OrchestratorConfig:
     # Analytics
     enable_analytics: bool = True
     metrics_retention_days: int = 30
+    metrics_batch_latency_ms: int = 500  # coalesce metric records within this window
+    metrics_queue_max: int = 1000  # oldest queued metrics are dropped beyond this
 
     # Recovery
     auto_restart_on_failure: bool = True
@@ -85,8 +176,15 @@ class OrchestratorConfig:
     max_concurrent_debates: int = 1
     cleanup_interval_hours: int = 24
 
+    # User callback delivery: "immediate" awaits inline, "soon" runs on the
+    # next loop iteration, "later" after callback_latency_ms, and "custom"
+    # hands (callback, args) to dispatch_fn
+    callback_dispatch: Literal["immediate", "soon", "later", "custom"] = "immediate"
+    callback_latency_ms: int = 100
+    dispatch_fn: Optional[Callable] = None
+
 
-@dataclass
+@dataclass(slots=True)
 class OrchestratorStats:
     """Statistics for orchestrator operation"""
     start_time: datetime = field(default_factory=datetime.now)
@@ -110,6 +208,17 @@ class AutomationOrchestrator:
         """Initialize orchestrator with configuration"""
         self.config = config or OrchestratorConfig()
         self.stats = OrchestratorStats()
+        # Monotonic twin of stats.start_time, used for uptime
+        self._start_monotonic = time.monotonic()
+
+        if self.config.callback_dispatch not in ("immediate", "soon", "later", "custom"):
+            raise ValueError(f"Unknown callback_dispatch: {self.config.callback_dispatch}")
+        if self.config.callback_dispatch == "custom" and not self.config.dispatch_fn:
+            raise ValueError("callback_dispatch='custom' requires dispatch_fn")
+        if self.config.cleanup_interval_hours <= 0:
+            raise ValueError(
+                f"cleanup_interval_hours must be positive: {self.config.cleanup_interval_hours}"
+            )
 
         # Initialize components
         self.scheduler: Optional[DebateScheduler] = None
@@ -120,56 +229,58 @@ class AutomationOrchestrator:
         # State management
         self.state = SystemState.INITIALIZING
         self.running = False
+        # Set by stop() so the periodic loops wake immediately instead of finishing their sleep
+        self._stop_event = asyncio.Event()
         self.current_debate_id: Optional[str] = None
+        # Metrics waiting to be recorded as one batch
+        self._metrics_queue: deque = deque(maxlen=self.config.metrics_queue_max)
+        self._metrics_dropped = 0
+        self._metrics_flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Last generated schedule: (start hour, duration_hours, debates)
+        self._schedule_cache: Optional[tuple] = None
+
+        # Consecutive healthy sweeps, saturating at _HEALTH_MULTIPLIER_MAX
+        self._health_multiplier = 0
 
         # Callbacks
         self.on_debate_start: Optional[Callable] = None
         self.on_debate_complete: Optional[Callable] = None
         self.on_debate_error: Optional[Callable] = None
+        # Called with a list of critical alerts raised in the same loop tick,
+        # or with the monitor statistics when overall health turns critical
         self.on_critical_alert: Optional[Callable] = None
 
-        logger.info(f"Orchestrator initialized in {self.config.mode.value} mode")
+        # Enabled components reported by get_status, fixed by initialize()
+        self._components: Dict[str, bool] = dict.fromkeys(
+            ('scheduler', 'streamer', 'monitor', 'analytics'), False
+        )
+
+        # Component statistics for get_statistics, rebuilt only after events
+        self._component_stats: Dict[str, Any] = {}
+        self._stats_dirty = True
+
+        # Deferred user callbacks and critical alert flushes still running
+        self._callback_tasks: Set[asyncio.Task] = set()
+
+        # Critical alerts waiting for the grouped on_critical_alert call
+        self._pending_critical: List[Alert] = []
+        self._critical_flush_task: Optional[asyncio.Task] = None
+
+        logger.info("Orchestrator initialized in %s mode", self.config.mode.value)
 
     async def initialize(self):
         """Initialize all components"""
         logger.info("Initializing orchestrator components...")
 
         try:
-            # Initialize scheduler
-            schedule_config = self.config.schedule_config or ScheduleConfig()
-            self.scheduler = DebateScheduler(schedule_config)
-            logger.info("✓ Scheduler initialized")
-
-            # Initialize streamer
-            if self.config.enable_streaming:
-                self.streamer = MultiPlatformStreamer()
-                logger.info("✓ Streamer initialized")
-
-            # Initialize health monitor
-            if self.config.enable_health_monitoring:
-                self.monitor = HealthMonitor(
-                    check_interval_seconds=self.config.health_check_interval
-                )
-                # Register default health checks
-                from .monitoring import (
-                    check_scheduler_health,
-                    check_streaming_health,
-                    check_disk_space,
-                    check_memory_usage
-                )
-                self.monitor.register_check("scheduler", check_scheduler_health)
-                self.monitor.register_check("streaming", check_streaming_health)
-                self.monitor.register_check("disk_space", check_disk_space)
-                self.monitor.register_check("memory", check_memory_usage)
-
-                # Set alert callback
-                self.monitor.on_alert = self._handle_alert
-                logger.info("✓ Health monitor initialized")
-
-            # Initialize analytics
-            if self.config.enable_analytics:
-                self.dashboard = AnalyticsDashboard()
-                logger.info("✓ Analytics dashboard initialized")
+            # Components are independent, so build them concurrently
+            self.scheduler, self.streamer, self.monitor, self.dashboard = await asyncio.gather(
+                self._init_scheduler(),
+                self._init_streamer(),
+                self._init_monitor(),
+                self._init_dashboard()
+            )
 
             # Set scheduler callbacks
             if self.scheduler:
@@ -179,81 +290,150 @@ class AutomationOrchestrator:
                     on_error=self._on_debate_error
                 )
 
-            self.state = SystemState.STOPPED
+            self._components = {
+                'scheduler': self.scheduler is not None,
+                'streamer': self.streamer is not None and self.config.enable_streaming,
+                'monitor': self.monitor is not None and self.config.enable_health_monitoring,
+                'analytics': self.dashboard is not None and self.config.enable_analytics
+            }
+
+            self._transition("initialized")
             logger.info("Orchestrator initialization complete")
 
         except Exception as e:
-            self.state = SystemState.ERROR
-            logger.error(f"Orchestrator initialization failed: {e}")
+            self._transition("fail")
+            logger.error("Orchestrator initialization failed: %s", e)
             raise
 
+    async def _init_scheduler(self) -> DebateScheduler:
+        """Build the debate scheduler"""
+        schedule_config = self.config.schedule_config or ScheduleConfig()
+        scheduler = DebateScheduler(schedule_config)
+        logger.info("✓ Scheduler initialized")
+        return scheduler
+
+    async def _init_streamer(self) -> Optional[MultiPlatformStreamer]:
+        """Build the streamer, if streaming is enabled"""
+        if not self.config.enable_streaming:
+            return None
+        streamer = MultiPlatformStreamer()
+        logger.info("✓ Streamer initialized")
+        return streamer
+
+    async def _init_monitor(self) -> Optional[HealthMonitor]:
+        """Build the health monitor with the default checks, if enabled"""
+        if not self.config.enable_health_monitoring:
+            return None
+
+        monitor = HealthMonitor(
+            check_interval_seconds=self.config.health_check_interval
+        )
+        # Register default health checks
+        from .monitoring import (
+            check_scheduler_health,
+            check_streaming_health,
+            check_disk_space,
+            check_memory_usage
+        )
+        monitor.register_check("scheduler", check_scheduler_health)
+        monitor.register_check("streaming", check_streaming_health)
+        monitor.register_check("disk_space", check_disk_space)
+        monitor.register_check("memory", check_memory_usage)
+
+        # Set alert callback
+        monitor.on_alert = self._handle_alert
+        logger.info("✓ Health monitor initialized")
+        return monitor
+
+    async def _init_dashboard(self) -> Optional[AnalyticsDashboard]:
+        """Build the analytics dashboard, if enabled"""
+        if not self.config.enable_analytics:
+            return None
+        dashboard = AnalyticsDashboard()
+        logger.info("✓ Analytics dashboard initialized")
+        return dashboard
+
     async def start(self):
         """Start the orchestrator"""
-        if self.state == SystemState.RUNNING:
-            logger.warning("Orchestrator already running")
+        if not self._transition("start"):
             return
 
         logger.info("Starting orchestrator...")
+        self._stop_event.clear()
         self.running = True
-        self.state = SystemState.RUNNING
         self.stats.start_time = datetime.now()
-        self.stats.current_state = SystemState.RUNNING
+        self._start_monotonic = time.monotonic()
 
         try:
-            # Start components
-            tasks = []
-
-            # Start scheduler
-            if self.scheduler and self.config.auto_start_debates:
-                tasks.append(asyncio.create_task(self._run_scheduler()))
-
-            # Start health monitoring
-            if self.monitor:
-                tasks.append(asyncio.create_task(self._run_health_monitoring()))
-
-            # Start cleanup task
-            tasks.append(asyncio.create_task(self._run_cleanup()))
-
-            # Wait for all tasks
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-        except Exception as e:
-            logger.error(f"Orchestrator error: {e}")
-            self.state = SystemState.ERROR
+            # Start components; a failure in one cancels the others
+            async with asyncio.TaskGroup() as tg:
+                # Start scheduler
+                if self.scheduler and self.config.auto_start_debates:
+                    tg.create_task(self._run_scheduler())
+
+                # Start health monitoring
+                if self.monitor:
+                    tg.create_task(self._run_health_monitoring())
+
+                # Start cleanup task
+                tg.create_task(self._run_cleanup())
+
+        except ExceptionGroup as eg:
+            for e in eg.exceptions:
+                logger.error("Orchestrator error: %s", e)
+            self._transition("fail")
             raise
 
     async def stop(self):
         """Stop the orchestrator gracefully"""
         logger.info("Stopping orchestrator...")
+        self._stop_event.set()
         self.running = False
-        self.state = SystemState.STOPPING
+        self._transition("stop")
 
         # Stop streaming if active
         if self.streamer:
             try:
                 await self.streamer.stop_streaming()
             except Exception as e:
-                logger.error(f"Error stopping streamer: {e}")
+                logger.error("Error stopping streamer: %s", e)
 
         # Stop scheduler
         if self.scheduler:
-            self.scheduler.running = False
+            await self.scheduler.stop()
 
-        self.state = SystemState.STOPPED
-        self.stats.current_state = SystemState.STOPPED
+        # Stop health monitoring and its alert delivery
+        if self.monitor:
+            self.monitor.stop_monitoring()
+
+        # Write out any buffered analytics records
+        if self.dashboard:
+            self._flush_metrics()
+            await self.dashboard.aclose()
+
+        self._transition("stopped")
         logger.info("Orchestrator stopped")
 
     async def pause(self):
         """Pause orchestrator operation"""
-        logger.info("Pausing orchestrator...")
-        self.state = SystemState.PAUSED
-        self.stats.current_state = SystemState.PAUSED
+        if self._transition("pause"):
+            logger.info("Orchestrator paused")
 
     async def resume(self):
         """Resume orchestrator operation"""
-        logger.info("Resuming orchestrator...")
-        self.state = SystemState.RUNNING
-        self.stats.current_state = SystemState.RUNNING
+        if self._transition("resume"):
+            logger.info("Orchestrator resumed")
+
+    def _transition(self, event: str) -> bool:
+        """Apply a lifecycle event; returns False if the current state does not allow it"""
+        new_state = _TRANSITIONS.get((self.state, event))
+        if new_state is None:
+            logger.warning("Cannot %s orchestrator while %s", event, _STATE_NAMES[self.state])
+            return False
+
+        self.state = self.stats.current_state = new_state
+        self._stats_dirty = True
+        return True
 
     async def _run_scheduler(self):
         """Run the debate scheduler loop"""
@@ -261,12 +441,20 @@ class AutomationOrchestrator:
 
         # Generate initial schedule
         if self.config.mode == OrchestratorMode.CONTINUOUS:
-            # Generate 24-hour rolling schedule
-            debates = self.scheduler.generate_schedule(
-                start_time=datetime.now(),
-                duration_hours=24
-            )
-            logger.info(f"Generated {len(debates)} debates for next 24 hours")
+            # Generate 24-hour rolling schedule, once per start hour; a restart
+            # within the hour reuses it instead of queueing the debates again
+            now = datetime.now()
+            key = (now.replace(minute=0, second=0, microsecond=0), 24)
+            if self._schedule_cache and self._schedule_cache[:2] == key:
+                debates = self._schedule_cache[2]
+                logger.info("Reusing %s debates scheduled this hour", len(debates))
+            else:
+                debates = self.scheduler.generate_schedule(
+                    start_time=now,
+                    duration_hours=key[1]
+                )
+                self._schedule_cache = (*key, debates)
+                logger.info("Generated %s debates for next 24 hours", len(debates))
 
         await self.scheduler.start()
 
@@ -274,38 +462,61 @@ class AutomationOrchestrator:
         """Run health monitoring loop"""
         logger.info("Starting health monitoring loop...")
 
-        while self.running:
+        while not self._stop_event.is_set():
             try:
                 # Run health checks
                 await self.monitor.run_all_checks()
                 self.stats.last_health_check = datetime.now()
+                self._stats_dirty = True
 
                 # Check overall status
                 status = self.monitor.get_overall_status()
 
+                # Back off while healthy, return to the base interval on trouble
+                if status == HealthStatus.HEALTHY:
+                    self._health_multiplier = min(_HEALTH_MULTIPLIER_MAX, self._health_multiplier + 1)
+                else:
+                    self._health_multiplier = 0
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Health check: %s (next in %.0fs)", status.value, self._health_check_delay()
+                    )
+
                 if status == HealthStatus.CRITICAL and self.config.alert_on_failure:
                     logger.critical("System health is CRITICAL")
                     if self.on_critical_alert:
-                        await self.on_critical_alert(self.monitor.get_statistics())
-
-                # Wait for next check
-                await asyncio.sleep(self.config.health_check_interval)
+                        await self._dispatch(self.on_critical_alert, self.monitor.get_statistics())
 
             except Exception as e:
-                logger.error(f"Health monitoring error: {e}")
-                await asyncio.sleep(self.config.health_check_interval)
+                logger.error("Health monitoring error: %s", e)
+                self._health_multiplier = 0
+
+            # Wait for next check, or until stop() is called
+            if await self._wait_for_stop(self._health_check_delay()):
+                break
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds; return True if stop() was called meanwhile"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _health_check_delay(self) -> float:
+        """Seconds until the next health sweep, scaled by the health multiplier"""
+        return self.config.health_check_interval * (
+            self._health_multiplier / _HEALTH_MULTIPLIER_MAX + 1
+        )
 
     async def _run_cleanup(self):
         """Run periodic cleanup tasks"""
         logger.info("Starting cleanup loop...")
 
-        interval_seconds = self.config.cleanup_interval_hours * 3600
-
-        while self.running:
+        while not self._stop_event.is_set():
             try:
-                await asyncio.sleep(interval_seconds)
-
-                if not self.running:
+                if await self._wait_for_stop(self._next_cleanup_delay()):
                     break
 
                 logger.info("Running cleanup tasks...")
@@ -313,22 +524,56 @@ class AutomationOrchestrator:
                 # Cleanup old analytics data
                 if self.dashboard:
                     # This would cleanup data older than retention period
-                    logger.info(f"Cleanup: Analytics data older than {self.config.metrics_retention_days} days")
+                    logger.info(
+                        "Cleanup: Analytics data older than %s days", self.config.metrics_retention_days
+                    )
 
                 # Cleanup old recordings if needed
-                if self.config.recording_path:
-                    # This would cleanup old recording files
-                    logger.info("Cleanup: Old recording files")
+                if self.config.recording_path and self.config.recording_retention_days:
+                    cutoff_ts = time.time() - self.config.recording_retention_days * 86400
+                    removed = await self._cleanup_recordings(
+                        Path(self.config.recording_path), cutoff_ts
+                    )
+                    logger.info("Cleanup: Removed %s old recording files", removed)
 
                 logger.info("Cleanup tasks complete")
 
             except Exception as e:
-                logger.error(f"Cleanup error: {e}")
+                logger.error("Cleanup error: %s", e)
+
+    def _next_cleanup_delay(self) -> float:
+        """
+        Seconds until the next cleanup boundary
+
+        Boundaries are multiples of the cleanup interval since the Unix epoch,
+        so every instance cleans up at the same wall-clock times (e.g. UTC
+        midnight for a 24 hour interval) regardless of when it started.
+        """
+        interval_seconds = self.config.cleanup_interval_hours * 3600
+        return interval_seconds - time.time() % interval_seconds
+
+    async def _cleanup_recordings(self, recording_path: Path, cutoff_ts: float) -> int:
+        """Delete recordings older than cutoff_ts, scanning in a worker thread"""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        producer = loop.run_in_executor(None, _scan_recordings, recording_path, loop, queue)
+
+        # Only one batch is handled on the loop at a time
+        removed = 0
+        while (batch := await queue.get()) is not _SCAN_DONE:
+            stale = [path for path, mtime in batch if mtime < cutoff_ts]
+            if stale:
+                removed += await _to_thread(_unlink_files, stale)
+
+        # Surface scan errors
+        await producer
+        return removed
 
     async def _on_debate_start(self, debate):
         """Handle debate start event"""
-        logger.info(f"Debate starting: {debate.debate_id}")
+        logger.info("Debate starting: %s", debate.debate_id)
         self.current_debate_id = debate.debate_id
+        self._stats_dirty = True
 
         try:
             # Start streaming if enabled
@@ -342,53 +587,60 @@ class AutomationOrchestrator:
 
             # Call user callback
             if self.on_debate_start:
-                await self.on_debate_start(debate)
+                await self._dispatch(self.on_debate_start, debate)
 
         except Exception as e:
-            logger.error(f"Error starting debate components: {e}")
+            logger.error("Error starting debate components: %s", e)
             if self.on_debate_error:
-                await self.on_debate_error(debate, e)
+                await self._dispatch(self.on_debate_error, debate, e)
 
     async def _on_debate_complete(self, debate):
         """Handle debate completion event"""
-        logger.info(f"Debate completed: {debate.debate_id}")
+        logger.info("Debate completed: %s", debate.debate_id)
+        self._stats_dirty = True
+
+        dashboard = self.dashboard
+        streamer = self.streamer
 
         try:
             # Stop streaming
-            if self.streamer and self.streamer.is_streaming:
-                streaming_stats = self.streamer.get_statistics()
-                await self.streamer.stop_streaming()
+            streaming_stats = None
+            if streamer and streamer.is_streaming:
+                streaming_stats = streamer.get_statistics()
+                await streamer.stop_streaming()
                 logger.info("Streaming stopped")
 
+            if dashboard:
+                start_time = debate.actual_start_time
+                end_time = debate.actual_end_time
+                total_viewers = streaming_stats.get('total_viewers', 0) if streaming_stats is not None else 0
+
                 # Record streaming metrics
-                if self.dashboard:
-                    streaming_metrics = StreamingMetrics(
+                if streaming_stats is not None:
+                    self._enqueue_metric(StreamingMetrics(
                         session_id=debate.debate_id,
-                        start_time=debate.actual_start_time,
-                        end_time=debate.actual_end_time,
+                        start_time=start_time,
+                        end_time=end_time,
                         platforms=list(streaming_stats.get('destinations', {}).keys()),
-                        total_viewers_peak=streaming_stats.get('total_viewers', 0),
+                        total_viewers_peak=total_viewers,
                         avg_bitrate_kbps=streaming_stats.get('average_bitrate_kbps', 0),
                         total_bytes_sent=0,  # Would need to track this
                         uptime_percent=100.0,  # Would calculate from actual data
                         frame_drop_rate=0.0
-                    )
-                    self.dashboard.record_streaming(streaming_metrics)
+                    ))
 
-            # Record debate metrics
-            if self.dashboard:
-                debate_metrics = DebateMetrics(
+                # Record debate metrics
+                self._enqueue_metric(DebateMetrics(
                     debate_id=debate.debate_id,
-                    start_time=debate.actual_start_time,
-                    end_time=debate.actual_end_time,
-                    duration_seconds=(debate.actual_end_time - debate.actual_start_time).total_seconds(),
+                    start_time=start_time,
+                    end_time=end_time,
+                    duration_seconds=(end_time - start_time).total_seconds(),
                     topic=debate.topic or "General Discussion",
                     participant_count=5,  # Would get from actual debate
                     round_count=3,  # Would get from actual debate
                     engagement_score=0.75,  # Would calculate from actual data
-                    viewer_count_peak=streaming_stats.get('total_viewers', 0) if self.streamer else 0
-                )
-                self.dashboard.record_debate(debate_metrics)
+                    viewer_count_peak=total_viewers
+                ))
 
             # Update stats
             self.stats.total_debates_executed += 1
@@ -396,43 +648,133 @@ class AutomationOrchestrator:
 
             # Call user callback
             if self.on_debate_complete:
-                await self.on_debate_complete(debate)
+                await self._dispatch(self.on_debate_complete, debate)
 
         except Exception as e:
-            logger.error(f"Error completing debate: {e}")
+            logger.error("Error completing debate: %s", e)
             self.stats.total_debates_failed += 1
 
+    def _enqueue_metric(self, metrics: Union[DebateMetrics, StreamingMetrics]):
+        """Queue metrics for the dashboard, flushing after the batch latency"""
+        queue = self._metrics_queue
+        if len(queue) == queue.maxlen:
+            # Appending drops the oldest entry; alert once per batch window
+            self._metrics_dropped += 1
+            if self._metrics_dropped == 1 and self.monitor:
+                self.monitor.raise_alert(
+                    AlertSeverity.WARNING,
+                    "metrics_queue",
+                    f"Metrics queue full ({queue.maxlen}), dropping oldest records"
+                )
+        queue.append(metrics)
+        if self._metrics_flush_handle is None:
+            self._metrics_flush_handle = asyncio.get_running_loop().call_later(
+                self.config.metrics_batch_latency_ms / 1000, self._flush_metrics
+            )
+
+    def _flush_metrics(self):
+        """Record all queued metrics as one batch"""
+        if self._metrics_flush_handle is not None:
+            self._metrics_flush_handle.cancel()
+            self._metrics_flush_handle = None
+
+        if self._metrics_dropped:
+            logger.warning("Dropped %s queued metrics records", self._metrics_dropped)
+            self._metrics_dropped = 0
+
+        if not self._metrics_queue:
+            return
+
+        batch = list(self._metrics_queue)
+        self._metrics_queue.clear()
+        self._stats_dirty = True
+        if self.dashboard:
+            try:
+                self.dashboard.record_batch(batch)
+            except Exception as e:
+                logger.error("Error recording metrics batch: %s", e)
+
     async def _on_debate_error(self, debate, error):
         """Handle debate error event"""
-        logger.error(f"Debate error: {debate.debate_id} - {error}")
+        logger.error("Debate error: %s - %s", debate.debate_id, error)
 
         self.stats.total_debates_failed += 1
+        self._stats_dirty = True
 
         # Attempt recovery
         if self.config.auto_restart_on_failure and self.stats.restart_count < self.config.max_restart_attempts:
-            logger.info(f"Attempting auto-restart (attempt {self.stats.restart_count + 1}/{self.config.max_restart_attempts})")
+            logger.info(
+                "Attempting auto-restart (attempt %s/%s)",
+                self.stats.restart_count + 1, self.config.max_restart_attempts
+            )
             await asyncio.sleep(self.config.restart_delay_seconds)
             self.stats.restart_count += 1
             # Would retry debate here
 
         # Call user callback
         if self.on_debate_error:
-            await self.on_debate_error(debate, error)
+            await self._dispatch(self.on_debate_error, debate, error)
 
     async def _handle_alert(self, alert):
         """Handle health monitoring alerts"""
-        logger.warning(f"Alert: [{alert.severity.value}] {alert.component}: {alert.message}")
+        logger.warning("Alert: [%s] %s: %s", alert.severity.value, alert.component, alert.message)
+        self._stats_dirty = True
 
         if alert.severity == AlertSeverity.CRITICAL and self.on_critical_alert:
-            await self.on_critical_alert(alert)
+            self._pending_critical.append(alert)
+            if self._critical_flush_task is None:
+                task = asyncio.create_task(self._flush_critical_alerts())
+                self._critical_flush_task = task
+                # Held in _callback_tasks until done; the flush clears
+                # _critical_flush_task as soon as it takes the pending batch
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_done)
+
+    async def _flush_critical_alerts(self):
+        """Deliver all pending critical alerts in one on_critical_alert call"""
+        alerts, self._pending_critical = self._pending_critical, []
+        self._critical_flush_task = None
+
+        if alerts and self.on_critical_alert:
+            try:
+                await self._dispatch(self.on_critical_alert, alerts)
+            except Exception as e:
+                logger.error("Critical alert callback failed: %s", e)
+
+    async def _dispatch(self, callback: Callable, *args):
+        """Invoke a user callback according to config.callback_dispatch"""
+        mode = self.config.callback_dispatch
+
+        if mode == "immediate":
+            await callback(*args)
+        elif mode == "soon":
+            asyncio.get_running_loop().call_soon(self._spawn_callback, callback, args)
+        elif mode == "later":
+            asyncio.get_running_loop().call_later(
+                self.config.callback_latency_ms / 1000, self._spawn_callback, callback, args
+            )
+        else:
+            self.config.dispatch_fn(callback, args)
+
+    def _spawn_callback(self, callback: Callable, args: tuple):
+        """Run a deferred user callback as a task"""
+        task = asyncio.create_task(callback(*args))
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task):
+        """Forget a finished deferred callback, logging any failure"""
+        self._callback_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error("Callback error: %s", task.exception())
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get orchestrator statistics"""
-        uptime = (datetime.now() - self.stats.start_time).total_seconds()
+        uptime = time.monotonic() - self._start_monotonic
 
         stats = {
-            'state': self.state.value,
-            'mode': self.config.mode.value,
+            'state': _STATE_NAMES[self.state],
+            'mode': _MODE_NAMES[self.config.mode],
             'uptime_seconds': uptime,
             'uptime_hours': uptime / 3600,
             'total_debates': self.stats.total_debates_executed,
@@ -446,35 +788,36 @@ class AutomationOrchestrator:
             'restart_count': self.stats.restart_count
         }
 
-        # Add component stats
-        if self.scheduler:
-            stats['scheduler'] = self.scheduler.get_statistics()
+        # Add component stats, reusing the last snapshot until an event changes them
+        if self._stats_dirty:
+            component_stats = {}
+            if self.scheduler:
+                component_stats['scheduler'] = self.scheduler.get_statistics()
 
-        if self.streamer:
-            stats['streaming'] = self.streamer.get_statistics()
+            if self.streamer:
+                component_stats['streaming'] = self.streamer.get_statistics()
 
-        if self.monitor:
-            stats['health'] = self.monitor.get_statistics()
+            if self.monitor:
+                component_stats['health'] = self.monitor.get_statistics()
 
-        if self.dashboard:
-            stats['analytics'] = self.dashboard.get_dashboard_data()
+            if self.dashboard:
+                component_stats['analytics'] = self.dashboard.get_dashboard_data()
+
+            self._component_stats = component_stats
+            self._stats_dirty = False
 
+        stats.update(self._component_stats)
         return stats
 
     def get_status(self) -> Dict[str, Any]:
         """Get current orchestrator status"""
         return {
-            'state': self.state.value,
+            'state': _STATE_NAMES[self.state],
             'running': self.running,
-            'mode': self.config.mode.value,
+            'mode': _MODE_NAMES[self.config.mode],
             'current_debate': self.current_debate_id,
-            'components': {
-                'scheduler': self.scheduler is not None,
-                'streamer': self.streamer is not None and self.config.enable_streaming,
-                'monitor': self.monitor is not None and self.config.enable_health_monitoring,
-                'analytics': self.dashboard is not None and self.config.enable_analytics
-            },
-            'streaming_active': self.streamer.is_streaming if self.streamer else False,
+            'components': self._components.copy(),
+            'streaming_active': bool(self.streamer and self.streamer.is_streaming),
             'last_health_check': self.stats.last_health_check.isoformat() if self.stats.last_health_check else None
         }
 
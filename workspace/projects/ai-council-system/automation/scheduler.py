@@ -8,13 +8,66 @@ Author: AI Council System
 Phase: 5.1 - Automation & Scale
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import List, Optional, Dict, Callable, Any
+from typing import Iterator, List, Optional, Dict, Callable, Any, Tuple
 import asyncio
+import heapq
+import inspect
+from itertools import count
+from operator import attrgetter
 from pathlib import Path
 import json
+import logging
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Saves requested within this window are collapsed into a single write
+_SAVE_COALESCE_SECONDS = 0.5
+
+# Rebuild the pending heap once more than this fraction of a queue of at least
+# _MIN_COMPACT_QUEUE entries are debates that already left PENDING
+_MIN_COMPACT_QUEUE = 100
+_MAX_STALE_FRACTION = 0.5
+
+
+async def _maybe_await(callback: Callable, *args) -> None:
+    """Call a lifecycle callback, awaiting it only if it returned an awaitable"""
+    result = callback(*args)
+    if inspect.isawaitable(result):
+        await result
+
+
+_scheduled_time_of = attrgetter("scheduled_time")
+
+
+def _debate_id(timestamp: float) -> str:
+    """Build the id of a debate scheduled at a POSIX timestamp"""
+    return f"debate_{int(timestamp)}"
+
+
+def _dumps_indented(obj: Any) -> bytes:
+    """Serialize obj as indented JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _write_json_atomic(path: Path, data: Dict):
+    """Write data as JSON to a temporary file, then rename it over path"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(_dumps_indented(data))
+    os.replace(tmp_path, path)
 
 
 class ScheduleType(Enum):
@@ -46,9 +99,34 @@ class ScheduleConfig:
     quiet_hours_end: int = 6    # 6 AM
     adaptive_mode: bool = True
     require_trending_topic: bool = False
+    # Bit h is set when hour h falls within quiet hours; kept in step with
+    # quiet_hours_start/quiet_hours_end by __setattr__
+    quiet_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._update_quiet_mask()
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in ("quiet_hours_start", "quiet_hours_end") and "quiet_mask" in self.__dict__:
+            self._update_quiet_mask()
+
+    def _update_quiet_mask(self):
+        """Recompute quiet_mask from the quiet hours window"""
+        start, end = self.quiet_hours_start, self.quiet_hours_end
+        mask = 0
+        for hour in range(24):
+            if start < end:
+                quiet = start <= hour < end
+            else:
+                # Quiet hours span midnight
+                quiet = hour >= start or hour < end
+            if quiet:
+                mask |= 1 << hour
+        self.quiet_mask = mask
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledDebate:
     """A scheduled debate"""
     debate_id: str
@@ -70,7 +148,7 @@ class ScheduledDebate:
             "actual_start_time": self.actual_start_time.isoformat() if self.actual_start_time else None,
             "actual_end_time": self.actual_end_time.isoformat() if self.actual_end_time else None,
             "error_message": self.error_message,
-            "metadata": self.metadata
+            "metadata": dict(self.metadata)
         }
 
 
@@ -96,14 +174,38 @@ class DebateScheduler:
         """
         self.config = config
         self.schedule: List[ScheduledDebate] = []
+        # Min-heap of (scheduled timestamp, seq, debate) for debates awaiting
+        # execution; entries whose debate has left PENDING are dropped lazily
+        # from the head. Ordering on the float timestamp avoids datetime
+        # comparisons, and seq keeps ties in insertion order.
+        self._queue: List[Tuple[float, int, ScheduledDebate]] = []
+        self._seq = count()
+        # Queue entries known to have left PENDING but not yet popped
+        self._stale_entries = 0
+        # Most recent debate for each debate_id
+        self._by_id: Dict[str, ScheduledDebate] = {}
+        # Number of debates in self.schedule per calendar date
+        self._per_date_counts: Dict[date, int] = defaultdict(int)
         self.current_debate: Optional[ScheduledDebate] = None
         self.running = False
+        # Set whenever the queue changes so start() can recompute its timer
+        self._wake = asyncio.Event()
+        # Earliest time the next debate may start (min_interval after the last one)
+        self._resume_at = datetime.min
+
+        # Background schedule persistence, enabled by the first save_schedule()
+        self._save_path: Optional[Path] = None
+        self._save_pending = False
+        self._save_task: Optional[asyncio.Task] = None
 
         # Callbacks
         self.on_debate_start: Optional[Callable] = None
         self.on_debate_complete: Optional[Callable] = None
         self.on_debate_error: Optional[Callable] = None
 
+        # Blocking debate pipeline, called as fn(debate) in a worker thread
+        self.debate_pipeline_sync: Optional[Callable] = None
+
         # Statistics
         self.total_debates_scheduled = 0
         self.total_debates_completed = 0
@@ -115,7 +217,12 @@ class DebateScheduler:
         on_complete: Optional[Callable] = None,
         on_error: Optional[Callable] = None
     ):
-        """Set callback functions for debate lifecycle"""
+        """
+        Set callback functions for debate lifecycle
+
+        Callbacks may be plain functions or coroutine functions; plain ones are
+        called inline without creating a coroutine, so they must not block.
+        """
         self.on_debate_start = on_start
         self.on_debate_complete = on_complete
         self.on_debate_error = on_error
@@ -135,9 +242,32 @@ class DebateScheduler:
             metadata: Optional metadata
 
         Returns:
-            ScheduledDebate object
+            ScheduledDebate object; an identical pending request (same
+            debate_id and topic) returns the debate already queued
         """
-        debate_id = f"debate_{int(scheduled_time.timestamp())}"
+        timestamp = scheduled_time.timestamp()
+
+        existing = self._by_id.get(_debate_id(timestamp))
+        if existing and existing.status == DebateStatus.PENDING and existing.topic == topic:
+            return existing
+
+        entry = self._new_entry(scheduled_time, timestamp, topic, metadata)
+        heapq.heappush(self._queue, entry)
+        self._wake.set()
+        self._mark_dirty()
+        return entry[2]
+
+    def _new_entry(
+        self,
+        scheduled_time: datetime,
+        timestamp: Optional[float] = None,
+        topic: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Tuple[float, int, ScheduledDebate]:
+        """Create and record a debate, returning its queue entry without queueing it"""
+        if timestamp is None:
+            timestamp = scheduled_time.timestamp()
+        debate_id = _debate_id(timestamp)
 
         debate = ScheduledDebate(
             debate_id=debate_id,
@@ -147,12 +277,11 @@ class DebateScheduler:
         )
 
         self.schedule.append(debate)
+        self._by_id[debate_id] = debate
+        self._per_date_counts[scheduled_time.date()] += 1
         self.total_debates_scheduled += 1
 
-        # Sort schedule by time
-        self.schedule.sort(key=lambda d: d.scheduled_time)
-
-        return debate
+        return (timestamp, next(self._seq), debate)
 
     def generate_schedule(
         self,
@@ -171,10 +300,12 @@ class DebateScheduler:
         """
         end_time = start_time + timedelta(hours=duration_hours)
         current_time = start_time
-        scheduled = []
+        entries = []
 
         if self.config.schedule_type == ScheduleType.INTERVAL:
             # Fixed interval scheduling
+            step = timedelta(minutes=self.config.interval_minutes)
+
             while current_time < end_time:
                 # Skip quiet hours
                 if self._is_quiet_hour(current_time):
@@ -188,10 +319,17 @@ class DebateScheduler:
                     current_time = current_time.replace(hour=self.config.quiet_hours_end)
                     continue
 
-                debate = self.schedule_debate(current_time)
-                scheduled.append(debate)
+                # Every slot before the next midnight, quiet period or end_time
+                # passes both checks above, so schedule that run in one go
+                slots = self.config.max_debates_per_day - debates_today
+                if step > timedelta(0):
+                    boundary = min(end_time, self._next_boundary(current_time))
+                    slots = min(slots, -((current_time - boundary) // step))
 
-                current_time += timedelta(minutes=self.config.interval_minutes)
+                for i in range(slots):
+                    entries.append(self._new_entry(current_time + i * step))
+
+                current_time += slots * step
 
         elif self.config.schedule_type == ScheduleType.ADAPTIVE:
             # Adaptive scheduling based on optimal times
@@ -206,44 +344,80 @@ class DebateScheduler:
                     if schedule_time < start_time or schedule_time > end_time:
                         continue
 
-                    debate = self.schedule_debate(schedule_time)
-                    scheduled.append(debate)
+                    entries.append(self._new_entry(schedule_time))
+
+        # Queue the whole batch with one heapify instead of a push per debate
+        self._queue.extend(entries)
+        heapq.heapify(self._queue)
+        self._wake.set()
+        self._mark_dirty()
 
-        return scheduled
+        return [entry[2] for entry in entries]
 
     def _is_quiet_hour(self, time: datetime) -> bool:
         """Check if time is within quiet hours"""
-        hour = time.hour
+        return bool((self.config.quiet_mask >> time.hour) & 1)
 
-        if self.config.quiet_hours_start < self.config.quiet_hours_end:
-            return self.config.quiet_hours_start <= hour < self.config.quiet_hours_end
-        else:
-            # Quiet hours span midnight
-            return hour >= self.config.quiet_hours_start or hour < self.config.quiet_hours_end
+    def _next_boundary(self, time: datetime) -> datetime:
+        """Next midnight or quiet-hours start after a non-quiet time"""
+        midnight = (time + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
 
-    def _count_debates_on_date(self, date) -> int:
-        """Count debates scheduled on a specific date"""
-        return sum(
-            1 for debate in self.schedule
-            if debate.scheduled_time.date() == date
+        quiet_start = time.replace(
+            hour=self.config.quiet_hours_start, minute=0, second=0, microsecond=0
         )
+        if quiet_start <= time:
+            quiet_start += timedelta(days=1)
 
-    def get_next_debate(self) -> Optional[ScheduledDebate]:
-        """Get the next pending debate"""
-        now = datetime.now()
+        return min(midnight, quiet_start)
+
+    def _count_debates_on_date(self, day: date) -> int:
+        """Count debates scheduled on a specific date"""
+        return self._per_date_counts.get(day, 0)
 
-        for debate in self.schedule:
-            if debate.status == DebateStatus.PENDING and debate.scheduled_time <= now:
-                return debate
+    def _peek_pending(self) -> Optional[ScheduledDebate]:
+        """Return the earliest queued pending debate, if any"""
+        queue = self._queue
+
+        # Drop debates that were started or cancelled since they were queued
+        while queue and queue[0][2].status != DebateStatus.PENDING:
+            heapq.heappop(queue)
+            if self._stale_entries:
+                self._stale_entries -= 1
+
+        return queue[0][2] if queue else None
+
+    def _entry_went_stale(self):
+        """Note a queued debate leaving PENDING, compacting the heap if mostly stale"""
+        self._stale_entries += 1
+
+        queue = self._queue
+        if len(queue) >= _MIN_COMPACT_QUEUE and self._stale_entries > len(queue) * _MAX_STALE_FRACTION:
+            self._compact_queue()
+
+    def _compact_queue(self):
+        """Rebuild the heap from its entries that are still PENDING"""
+        self._queue = [e for e in self._queue if e[2].status == DebateStatus.PENDING]
+        heapq.heapify(self._queue)
+        self._stale_entries = 0
+
+    def get_next_debate(self, now: Optional[datetime] = None) -> Optional[ScheduledDebate]:
+        """Get the next pending debate that is due at ``now`` (default: current time)"""
+        head = self._peek_pending()
+
+        if head and head.scheduled_time <= (now or datetime.now()):
+            return head
 
         return None
 
     def cancel_debate(self, debate_id: str) -> bool:
         """Cancel a scheduled debate"""
-        for debate in self.schedule:
-            if debate.debate_id == debate_id and debate.status == DebateStatus.PENDING:
-                debate.status = DebateStatus.CANCELLED
-                return True
+        debate = self._by_id.get(debate_id)
+        if debate and debate.status == DebateStatus.PENDING:
+            debate.status = DebateStatus.CANCELLED
+            self._entry_went_stale()
+            self._wake.set()
+            self._mark_dirty()
+            return True
         return False
 
     async def run_debate(self, debate: ScheduledDebate) -> bool:
@@ -256,14 +430,17 @@ class DebateScheduler:
         Returns:
             True if successful
         """
+        if debate.status == DebateStatus.PENDING:
+            self._entry_went_stale()
         debate.status = DebateStatus.RUNNING
         debate.actual_start_time = datetime.now()
         self.current_debate = debate
+        self._mark_dirty()
 
         try:
             # Call start callback
             if self.on_debate_start:
-                await self.on_debate_start(debate)
+                await _maybe_await(self.on_debate_start, debate)
 
             # Simulate debate execution (in production, call actual debate system)
             # This is where you'd integrate with:
@@ -273,8 +450,14 @@ class DebateScheduler:
             # - Debate execution
             # - Video generation
             # - Streaming
+            #
+            # Synchronous stages run in a worker thread so the event loop keeps
+            # serving callbacks and event triggers while they work.
 
-            await asyncio.sleep(2)  # Simulated debate time
+            if self.debate_pipeline_sync:
+                await asyncio.to_thread(self.debate_pipeline_sync, debate)
+            else:
+                await asyncio.sleep(2)  # Simulated debate time
 
             # Mark complete
             debate.status = DebateStatus.COMPLETED
@@ -283,7 +466,7 @@ class DebateScheduler:
 
             # Call complete callback
             if self.on_debate_complete:
-                await self.on_debate_complete(debate)
+                await _maybe_await(self.on_debate_complete, debate)
 
             return True
 
@@ -295,46 +478,69 @@ class DebateScheduler:
 
             # Call error callback
             if self.on_debate_error:
-                await self.on_debate_error(debate, e)
+                await _maybe_await(self.on_debate_error, debate, e)
 
             return False
 
         finally:
             self.current_debate = None
+            self._mark_dirty()
 
     async def start(self):
         """Start the automated scheduler"""
         self.running = True
-        print(f"🤖 Debate Scheduler started")
+        logger.info("Debate Scheduler started")
 
         while self.running:
-            # Check for next debate
-            next_debate = self.get_next_debate()
+            self._wake.clear()
+            now = datetime.now()
 
-            if next_debate:
-                print(f"▶️  Starting debate: {next_debate.debate_id}")
-                await self.run_debate(next_debate)
+            if now >= self._resume_at:
+                # Check for next debate
+                next_debate = self.get_next_debate(now)
 
-                # Wait minimum interval before next debate
-                await asyncio.sleep(self.config.min_interval_minutes * 60)
-            else:
-                # No pending debates, wait and check again
-                await asyncio.sleep(60)
+                if next_debate:
+                    logger.info("Starting debate: %s", next_debate.debate_id)
+                    await self.run_debate(next_debate)
+
+                    # Wait minimum interval before next debate
+                    self._resume_at = datetime.now() + timedelta(minutes=self.config.min_interval_minutes)
+                    continue
 
                 # Auto-generate next debate if adaptive mode
                 if self.config.adaptive_mode:
-                    self._auto_schedule_next()
+                    self._auto_schedule_next(now)
 
-    def _auto_schedule_next(self):
+            # Sleep until the next debate is due, or until the queue changes
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._delay_to_next_debate(now))
+            except asyncio.TimeoutError:
+                pass
+
+    def _delay_to_next_debate(self, now: datetime) -> Optional[float]:
+        """Seconds from now until the next queued debate may start, or None if none is queued"""
+        head = self._peek_pending()
+        if head is None:
+            # Wake when the post-debate interval ends so adaptive mode can refill
+            if now < self._resume_at:
+                return (self._resume_at - now).total_seconds()
+            return None
+
+        due = max(head.scheduled_time, self._resume_at)
+        return max(0.0, (due - now).total_seconds())
+
+    def _auto_schedule_next(self, now: Optional[datetime] = None):
         """Automatically schedule next debate"""
         # Check if we need to schedule more debates
-        pending_count = sum(
-            1 for d in self.schedule
+        pending_times = [
+            d.scheduled_time for d in self.schedule
             if d.status == DebateStatus.PENDING
-        )
+        ]
 
-        if pending_count < 3:  # Keep at least 3 debates queued
-            next_time = datetime.now() + timedelta(minutes=self.config.interval_minutes)
+        # Keep at least 3 debates queued, one interval after the last
+        next_time = max([now or datetime.now(), *pending_times])
+        for _ in range(3 - len(pending_times)):
+            next_time += timedelta(minutes=self.config.interval_minutes)
 
             # Adjust for quiet hours
             while self._is_quiet_hour(next_time):
@@ -345,7 +551,17 @@ class DebateScheduler:
     async def stop(self):
         """Stop the scheduler"""
         self.running = False
-        print(f"🛑 Debate Scheduler stopped")
+        self._wake.set()
+
+        # Let a queued save land before returning
+        if self._save_task:
+            await self._save_task
+
+        logger.info("Debate Scheduler stopped")
+
+    def iter_sorted(self) -> Iterator[ScheduledDebate]:
+        """Iterate over all debates in scheduled-time order"""
+        return iter(sorted(self.schedule, key=_scheduled_time_of))
 
     def get_schedule(
         self,
@@ -362,7 +578,7 @@ class DebateScheduler:
         Returns:
             List of debates
         """
-        debates = self.schedule
+        debates = list(self.iter_sorted())
 
         if status:
             debates = [d for d in debates if d.status == status]
@@ -374,48 +590,115 @@ class DebateScheduler:
 
     def get_statistics(self) -> Dict:
         """Get scheduler statistics"""
-        pending = sum(1 for d in self.schedule if d.status == DebateStatus.PENDING)
-        running = sum(1 for d in self.schedule if d.status == DebateStatus.RUNNING)
-        completed = sum(1 for d in self.schedule if d.status == DebateStatus.COMPLETED)
-        failed = sum(1 for d in self.schedule if d.status == DebateStatus.FAILED)
-        cancelled = sum(1 for d in self.schedule if d.status == DebateStatus.CANCELLED)
+        counts = dict.fromkeys(DebateStatus, 0)
+        for d in self.schedule:
+            counts[d.status] += 1
+
+        completed = counts[DebateStatus.COMPLETED]
+        failed = counts[DebateStatus.FAILED]
+        next_debate = self.get_next_debate()
 
         return {
             "total_scheduled": self.total_debates_scheduled,
             "total_completed": self.total_debates_completed,
             "total_failed": self.total_debates_failed,
-            "pending": pending,
-            "running": running,
+            "pending": counts[DebateStatus.PENDING],
+            "running": counts[DebateStatus.RUNNING],
             "completed": completed,
             "failed": failed,
-            "cancelled": cancelled,
+            "cancelled": counts[DebateStatus.CANCELLED],
             "success_rate": (completed / max(1, completed + failed)) * 100,
             "current_debate": self.current_debate.debate_id if self.current_debate else None,
-            "next_debate_time": self.get_next_debate().scheduled_time.isoformat() if self.get_next_debate() else None
+            "next_debate_time": next_debate.scheduled_time.isoformat() if next_debate else None
         }
 
     def save_schedule(self, path: Path):
-        """Save schedule to file"""
-        data = {
+        """
+        Save schedule to file
+
+        Inside a running event loop the write is deferred briefly and done in a
+        worker thread, so repeated saves collapse into one; later changes to the
+        schedule are then saved to the same path automatically. Without a
+        running loop the file is written immediately.
+
+        Args:
+            path: JSON file to write
+        """
+        self._save_path = path
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            _write_json_atomic(path, self._schedule_snapshot())
+            return
+
+        self._request_save()
+
+    def _mark_dirty(self):
+        """Queue a background save if the schedule is being persisted"""
+        if self._save_path is None:
+            return
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._request_save()
+
+    def _request_save(self):
+        """Start the save worker unless one is already waiting to write"""
+        self._save_pending = True
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._save_worker())
+
+    async def _save_worker(self):
+        """Write the schedule until no further save has been requested"""
+        try:
+            while self._save_pending:
+                await asyncio.sleep(_SAVE_COALESCE_SECONDS)
+                self._save_pending = False
+
+                # Snapshot to plain data on the loop, serialize and write off it
+                data = self._schedule_snapshot()
+                try:
+                    await asyncio.to_thread(_write_json_atomic, self._save_path, data)
+                except (OSError, TypeError, ValueError) as e:
+                    # TypeError/ValueError: metadata that JSON cannot encode
+                    logger.error("Failed to save schedule: %s", e)
+        finally:
+            self._save_task = None
+
+    def _schedule_snapshot(self) -> Dict:
+        """Build the JSON document written by save_schedule"""
+        return {
             "config": {
                 "schedule_type": self.config.schedule_type.value,
                 "interval_minutes": self.config.interval_minutes,
                 "max_debates_per_day": self.config.max_debates_per_day
             },
-            "debates": [d.to_dict() for d in self.schedule],
+            "debates": [d.to_dict() for d in self.iter_sorted()],
             "statistics": self.get_statistics()
         }
 
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2)
-
     def clear_completed(self):
         """Remove completed/failed/cancelled debates from schedule"""
-        self.schedule = [
-            d for d in self.schedule
-            if d.status in [DebateStatus.PENDING, DebateStatus.RUNNING]
-        ]
+        kept = []
+        per_date = self._per_date_counts
+        for d in self.schedule:
+            if d.status in [DebateStatus.PENDING, DebateStatus.RUNNING]:
+                kept.append(d)
+                continue
+
+            day = d.scheduled_time.date()
+            per_date[day] -= 1
+            if not per_date[day]:
+                del per_date[day]
+
+        self.schedule = kept
+        self._by_id = {d.debate_id: d for d in kept}
+        self._compact_queue()
+        self._mark_dirty()
 
 
 class EventTriggeredScheduler(DebateScheduler):
@@ -428,36 +711,90 @@ class EventTriggeredScheduler(DebateScheduler):
     def __init__(self, config: ScheduleConfig):
         super().__init__(config)
         self.event_threshold = 0.7  # Controversy threshold to trigger debate
+        self.coalesce_window = timedelta(minutes=10)  # Merge repeat events on a topic
+
+        # Pending event-triggered debate and its trigger time, by normalized topic
+        self._pending_by_topic: Dict[str, Tuple[ScheduledDebate, datetime]] = {}
+
+        # Wakes monitor_events before its next periodic check
+        self._event_signal = asyncio.Event()
 
     async def monitor_events(self):
         """Monitor events and trigger debates"""
         while self.running:
-            # Check for high-controversy events
+            # Check for high-controversy events every 5 minutes, or as soon as
+            # notify_event() reports one
             # In production, integrate with event ingestion system
-            await asyncio.sleep(300)  # Check every 5 minutes
+            try:
+                await asyncio.wait_for(self._event_signal.wait(), timeout=300)
+            except asyncio.TimeoutError:
+                pass
+            self._event_signal.clear()
+
+            if not self.running:
+                break
 
             # Simulate event detection
             if self.config.require_trending_topic:
                 # Would call actual event system here
                 pass
 
+    def notify_event(self):
+        """Wake monitor_events to check for events now, e.g. when a score crosses event_threshold"""
+        self._event_signal.set()
+
+    async def stop(self):
+        """Stop the scheduler and the event monitor"""
+        self._event_signal.set()
+        await super().stop()
+
     def trigger_debate_from_event(self, event_data: Dict) -> ScheduledDebate:
         """
         Trigger immediate debate from event
 
+        Events on the same topic within coalesce_window of a pending
+        event-triggered debate are merged into it (collected under
+        metadata["event_data_list"]) instead of queueing a duplicate.
+
         Args:
             event_data: Event information
 
         Returns:
             Scheduled debate
         """
+        now = datetime.now()
+        key = event_data["topic"].lower().strip() if event_data.get("topic") else None
+
+        if key is not None:
+            entry = self._pending_by_topic.get(key)
+            if entry:
+                existing, triggered_at = entry
+                if existing.status == DebateStatus.PENDING and now - triggered_at <= self.coalesce_window:
+                    metadata = existing.metadata
+                    metadata.setdefault("event_data_list", [metadata["event_data"]]).append(event_data)
+                    self._mark_dirty()
+                    return existing
+
         # Schedule for immediate execution
-        scheduled_time = datetime.now() + timedelta(minutes=5)
+        scheduled_time = now + timedelta(minutes=5)
 
         topic = event_data.get("topic", "Current Event")
 
-        return self.schedule_debate(
+        debate = self.schedule_debate(
             scheduled_time=scheduled_time,
             topic=topic,
             metadata={"event_triggered": True, "event_data": event_data}
         )
+
+        if key is not None:
+            self._pending_by_topic[key] = (debate, now)
+
+        return debate
+
+    def clear_completed(self):
+        """Remove completed/failed/cancelled debates from schedule"""
+        super().clear_completed()
+        self._pending_by_topic = {
+            key: entry for key, entry in self._pending_by_topic.items()
+            if entry[0].status == DebateStatus.PENDING
+        }
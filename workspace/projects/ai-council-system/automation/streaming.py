@@ -8,13 +8,17 @@ Author: AI Council System
 Phase: 5.1 - Automation & Scale
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Deque
 import asyncio
+import time
 from pathlib import Path
 
+import numpy as np
+
 
 class StreamPlatform(Enum):
     """Supported streaming platforms"""
@@ -24,6 +28,9 @@ class StreamPlatform(Enum):
     TWITTER = "twitter"
     CUSTOM_RTMP = "custom_rtmp"
 
+    # Hashed by identity so enum-keyed lookups (e.g. _by_platform) stay in C
+    __hash__ = object.__hash__
+
 
 class StreamStatus(Enum):
     """Stream status"""
@@ -34,6 +41,8 @@ class StreamStatus(Enum):
     ERROR = "error"
     STOPPED = "stopped"
 
+    __hash__ = object.__hash__
+
 
 class StreamQuality(Enum):
     """Stream quality presets"""
@@ -42,8 +51,33 @@ class StreamQuality(Enum):
     HIGH = "high"        # 1080p, 6000 kbps
     ULTRA = "ultra"      # 4K, 15000 kbps
 
+    __hash__ = object.__hash__
+
+
+# Stream health polling interval bounds (seconds): halved on any issue,
+# stepped up by _MONITOR_INTERVAL_STEP after each clean pass
+_MONITOR_INTERVAL_BASE = 10.0
+_MONITOR_INTERVAL_MIN = 1.0
+_MONITOR_INTERVAL_MAX = 30.0
+_MONITOR_INTERVAL_STEP = 1.0
+
+# Per-second latency samples kept per destination (a rolling 10 minutes)
+_LATENCY_WINDOW = 600
+
+# Target bitrate (kbps) for each quality preset
+_BITRATE_BY_QUALITY = {
+    StreamQuality.LOW: 1500,
+    StreamQuality.MEDIUM: 3000,
+    StreamQuality.HIGH: 6000,
+    StreamQuality.ULTRA: 15000,
+}
 
-@dataclass
+# Destination keys and status strings used in get_statistics output
+_PLATFORM_NAMES: Dict[StreamPlatform, str] = {platform: platform.value for platform in StreamPlatform}
+_STATUS_NAMES: Dict[StreamStatus, str] = {status: status.value for status in StreamStatus}
+
+
+@dataclass(slots=True)
 class StreamConfig:
     """Configuration for a stream"""
     platform: StreamPlatform
@@ -57,7 +91,7 @@ class StreamConfig:
     retry_delay_seconds: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamMetrics:
     """Real-time stream metrics"""
     platform: StreamPlatform
@@ -70,6 +104,7 @@ class StreamMetrics:
     viewer_count: int = 0
     latency_ms: float = 0.0
     last_error: Optional[str] = None
+    latency_samples: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
 
     def get_drop_rate(self) -> float:
         """Calculate frame drop rate"""
@@ -77,8 +112,16 @@ class StreamMetrics:
             return 0.0
         return (self.dropped_frames / self.total_frames) * 100
 
+    def get_latency_percentiles(self) -> Dict[str, float]:
+        """Get p50/p95/p99 latency over the rolling sample window"""
+        if not self.latency_samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+        p50, p95, p99 = np.quantile(np.fromiter(self.latency_samples, dtype=float), (0.5, 0.95, 0.99))
+        return {"p50": float(p50), "p95": float(p95), "p99": float(p99)}
 
-@dataclass
+
+@dataclass(slots=True)
 class StreamDestination:
     """A streaming destination"""
     config: StreamConfig
@@ -86,6 +129,8 @@ class StreamDestination:
     start_time: Optional[datetime] = None
     retry_count: int = 0
     last_error_time: Optional[datetime] = None
+    # time.monotonic() when the stream went live, for uptime measurement
+    _start_monotonic: Optional[float] = field(default=None, init=False, repr=False)
 
     def is_healthy(self) -> bool:
         """Check if stream is healthy"""
@@ -119,10 +164,24 @@ class MultiPlatformStreamer:
     def __init__(self):
         """Initialize multi-platform streamer"""
         self.destinations: List[StreamDestination] = []
+        # First destination added for each platform
+        self._by_platform: Dict[StreamPlatform, StreamDestination] = {}
         self.is_streaming = False
         self.recording_enabled = False
         self.recording_path: Optional[Path] = None
 
+        # Live destinations updated by the shared metrics tick, keyed by id()
+        self._ticking: Dict[int, StreamDestination] = {}
+        self._tick_task: Optional[asyncio.Task] = None
+        self._monitor_task: Optional[asyncio.Task] = None
+
+        # Running aggregates over LIVE destinations, kept by _set_status/_set_bitrate
+        self._live_count = 0
+        self._live_bitrate_sum = 0.0
+
+        # Current stream health polling interval
+        self._monitor_interval = _MONITOR_INTERVAL_BASE
+
         # Global metrics
         self.total_streams = 0
         self.total_stream_time_seconds = 0.0
@@ -149,15 +208,23 @@ class MultiPlatformStreamer:
         )
 
         self.destinations.append(destination)
+        self._by_platform.setdefault(config.platform, destination)
         return destination
 
     def remove_destination(self, platform: StreamPlatform) -> bool:
         """Remove a destination"""
+        if self._by_platform.pop(platform, None) is None:
+            return False
+
         initial_count = len(self.destinations)
-        self.destinations = [
-            d for d in self.destinations
-            if d.config.platform != platform
-        ]
+        kept = []
+        for d in self.destinations:
+            if d.config.platform != platform:
+                kept.append(d)
+            elif d.metrics.status == StreamStatus.LIVE:
+                self._live_count -= 1
+                self._live_bitrate_sum -= d.metrics.bitrate_kbps
+        self.destinations = kept
         return len(self.destinations) < initial_count
 
     async def start_streaming(self, recording_path: Optional[Path] = None):
@@ -177,89 +244,141 @@ class MultiPlatformStreamer:
 
         print(f"📡 Starting multi-platform stream to {len(self.destinations)} destinations...")
 
-        # Start each destination
-        tasks = []
-        for dest in self.destinations:
-            if dest.config.enabled:
-                task = asyncio.create_task(self._start_destination(dest))
-                tasks.append(task)
-
-        # Wait for all to start
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Start each destination and wait for all to start
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for dest in self.destinations:
+                    if dest.config.enabled:
+                        tg.create_task(self._start_destination(dest))
+        except* Exception:
+            # The failure cancelled the other connects; roll back to a stopped
+            # streamer so start_streaming can be called again
+            for dest in self.destinations:
+                if dest.metrics.status == StreamStatus.CONNECTING:
+                    self._set_status(dest, StreamStatus.STOPPED)
+            await self.stop_streaming()
+            raise
 
         # Monitor streams
-        asyncio.create_task(self._monitor_streams())
+        self._monitor_task = asyncio.create_task(self._monitor_streams())
 
         self.total_streams += 1
 
     async def _start_destination(self, destination: StreamDestination):
-        """Start streaming to a destination"""
-        destination.metrics.status = StreamStatus.CONNECTING
-
-        try:
-            # Simulate connection (in production, use actual RTMP streaming)
-            # Would use: ffmpeg, subprocess, or streaming library
-            await asyncio.sleep(2)
-
-            destination.metrics.status = StreamStatus.LIVE
-            destination.start_time = datetime.now()
-
-            print(f"✅ Connected to {destination.config.platform.value}")
-
-            # Simulate streaming
-            asyncio.create_task(self._stream_to_destination(destination))
-
-        except Exception as e:
-            destination.metrics.status = StreamStatus.ERROR
-            destination.metrics.last_error = str(e)
-            print(f"❌ Failed to connect to {destination.config.platform.value}: {e}")
-
-            # Retry if enabled
-            if destination.retry_count < destination.config.max_retry_attempts:
+        """Start streaming to a destination, retrying failed connections"""
+        while True:
+            self._set_status(destination, StreamStatus.CONNECTING)
+
+            try:
+                # Simulate connection (in production, use actual RTMP streaming)
+                # Would use: ffmpeg, subprocess, or streaming library
+                await asyncio.sleep(2)
+                break
+
+            except Exception as e:
+                self._set_status(destination, StreamStatus.ERROR)
+                destination.metrics.last_error = str(e)
+                print(f"❌ Failed to connect to {destination.config.platform.value}: {e}")
+
+                # Retry if enabled
+                if destination.retry_count >= destination.config.max_retry_attempts:
+                    return
                 destination.retry_count += 1
                 print(f"🔄 Retrying {destination.config.platform.value} (attempt {destination.retry_count})...")
                 await asyncio.sleep(destination.config.retry_delay_seconds)
-                await self._start_destination(destination)
 
-    async def _stream_to_destination(self, destination: StreamDestination):
-        """Stream content to a destination"""
-        while self.is_streaming and destination.config.enabled:
-            # Simulate streaming metrics
-            destination.metrics.fps = 30.0
-            destination.metrics.bitrate_kbps = self._get_target_bitrate(destination.config.quality)
-            destination.metrics.total_frames += 30  # 1 second at 30fps
+        self._set_status(destination, StreamStatus.LIVE)
+        destination.start_time = datetime.now()
+        destination._start_monotonic = time.monotonic()
+
+        print(f"✅ Connected to {destination.config.platform.value}")
+
+        # Simulate streaming
+        self._stream_to_destination(destination)
+
+    def _stream_to_destination(self, destination: StreamDestination):
+        """Stream content to a destination via the shared metrics tick"""
+        if not (self.is_streaming and destination.config.enabled):
+            return
 
-            # Simulate occasional dropped frames
-            if destination.metrics.total_frames % 300 == 0:
-                destination.metrics.dropped_frames += 1
+        self._update_metrics(destination, time.monotonic())
+        self._ticking[id(destination)] = destination
 
-            # Update uptime
-            if destination.start_time:
-                destination.metrics.uptime_seconds = (
-                    datetime.now() - destination.start_time
-                ).total_seconds()
+        if self._tick_task is None:
+            self._tick_task = asyncio.create_task(self._stream_tick())
 
-            await asyncio.sleep(1)
+    async def _stream_tick(self):
+        """Update every live destination once per second from a single task"""
+        try:
+            while self._ticking:
+                await asyncio.sleep(1)
+                if not self.is_streaming:
+                    break
+
+                now = time.monotonic()
+                for key, destination in list(self._ticking.items()):
+                    if destination.config.enabled:
+                        self._update_metrics(destination, now)
+                    else:
+                        del self._ticking[key]
+        finally:
+            self._tick_task = None
+
+    def _update_metrics(self, destination: StreamDestination, now: float):
+        """Advance a destination's simulated metrics by one second"""
+        # Simulate streaming metrics
+        destination.metrics.fps = 30.0
+        self._set_bitrate(destination, self._get_target_bitrate(destination.config.quality))
+        destination.metrics.total_frames += 30  # 1 second at 30fps
+
+        # Simulate occasional dropped frames
+        if destination.metrics.total_frames % 300 == 0:
+            destination.metrics.dropped_frames += 1
+
+        destination.metrics.latency_samples.append(destination.metrics.latency_ms)
+
+        # Update uptime
+        if destination._start_monotonic is not None:
+            destination.metrics.uptime_seconds = now - destination._start_monotonic
+
+    def _set_status(self, destination: StreamDestination, status: StreamStatus):
+        """Change a destination's status, keeping the live aggregates in step"""
+        metrics = destination.metrics
+        was_live = metrics.status == StreamStatus.LIVE
+        is_live = status == StreamStatus.LIVE
+
+        if was_live != is_live:
+            sign = 1 if is_live else -1
+            self._live_count += sign
+            self._live_bitrate_sum += sign * metrics.bitrate_kbps
+
+        metrics.status = status
+
+    def _set_bitrate(self, destination: StreamDestination, bitrate_kbps: float):
+        """Change a destination's bitrate, keeping the live aggregates in step"""
+        metrics = destination.metrics
+        if metrics.status == StreamStatus.LIVE:
+            self._live_bitrate_sum += bitrate_kbps - metrics.bitrate_kbps
+        metrics.bitrate_kbps = bitrate_kbps
 
     def _get_target_bitrate(self, quality: StreamQuality) -> float:
         """Get target bitrate for quality"""
-        bitrates = {
-            StreamQuality.LOW: 1500,
-            StreamQuality.MEDIUM: 3000,
-            StreamQuality.HIGH: 6000,
-            StreamQuality.ULTRA: 15000
-        }
-        return bitrates.get(quality, 3000)
+        return _BITRATE_BY_QUALITY.get(quality, 3000)
 
     async def _monitor_streams(self):
         """Monitor stream health and handle issues"""
+        self._monitor_interval = _MONITOR_INTERVAL_BASE
+
         while self.is_streaming:
+            issues = False
             for dest in self.destinations:
-                if not dest.config.enabled:
+                # Only enabled live streams can have health issues to act on
+                if not dest.config.enabled or dest.metrics.status != StreamStatus.LIVE:
                     continue
 
                 # Check health
-                if not dest.is_healthy() and dest.metrics.status == StreamStatus.LIVE:
+                if not dest.is_healthy():
+                    issues = True
                     print(f"⚠️  Health issue detected on {dest.config.platform.value}")
 
                     # Attempt recovery
@@ -267,7 +386,15 @@ class MultiPlatformStreamer:
                         print(f"🔄 Switching to backup URL for {dest.config.platform.value}")
                         # Switch to backup (in production)
 
-            await asyncio.sleep(10)  # Check every 10 seconds
+            # Poll faster while there are issues, back off while all is healthy
+            if issues:
+                self._monitor_interval = max(_MONITOR_INTERVAL_MIN, self._monitor_interval * 0.5)
+            else:
+                self._monitor_interval = min(
+                    _MONITOR_INTERVAL_MAX, self._monitor_interval + _MONITOR_INTERVAL_STEP
+                )
+
+            await asyncio.sleep(self._monitor_interval)
 
     async def stop_streaming(self):
         """Stop streaming to all destinations"""
@@ -277,25 +404,29 @@ class MultiPlatformStreamer:
         print("🛑 Stopping multi-platform stream...")
 
         self.is_streaming = False
+        self._ticking.clear()
+
+        # End the background tasks now rather than at their next wakeup
+        for task in (self._monitor_task, self._tick_task):
+            if task:
+                task.cancel()
+        self._monitor_task = None
+        now = time.monotonic()
 
         # Stop each destination
         for dest in self.destinations:
             if dest.metrics.status == StreamStatus.LIVE:
-                dest.metrics.status = StreamStatus.STOPPED
+                self._set_status(dest, StreamStatus.STOPPED)
 
                 # Update total stream time
-                if dest.start_time:
-                    duration = (datetime.now() - dest.start_time).total_seconds()
-                    self.total_stream_time_seconds += duration
+                if dest._start_monotonic is not None:
+                    self.total_stream_time_seconds += now - dest._start_monotonic
 
                 print(f"✅ Stopped {dest.config.platform.value}")
 
     def get_destination(self, platform: StreamPlatform) -> Optional[StreamDestination]:
         """Get destination by platform"""
-        for dest in self.destinations:
-            if dest.config.platform == platform:
-                return dest
-        return None
+        return self._by_platform.get(platform)
 
     def get_live_destinations(self) -> List[StreamDestination]:
         """Get all currently live destinations"""
@@ -314,37 +445,44 @@ class MultiPlatformStreamer:
 
     def get_average_bitrate(self) -> float:
         """Get average bitrate across live streams"""
-        live = self.get_live_destinations()
-        if not live:
+        if not self._live_count:
             return 0.0
 
-        return sum(d.metrics.bitrate_kbps for d in live) / len(live)
+        return self._live_bitrate_sum / self._live_count
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get streaming statistics"""
-        live_count = len(self.get_live_destinations())
-        total_count = len(self.destinations)
+        # One pass builds the per-destination entries and the viewer total
+        total_viewers = 0
+        destinations = {}
+        for dest in self.destinations:
+            metrics = dest.metrics
+            live = metrics.status == StreamStatus.LIVE
+            drop_rate = metrics.get_drop_rate()
+            if live:
+                total_viewers += metrics.viewer_count
+
+            destinations[_PLATFORM_NAMES[dest.config.platform]] = {
+                "status": _STATUS_NAMES[metrics.status],
+                "uptime_seconds": metrics.uptime_seconds,
+                "fps": metrics.fps,
+                "bitrate_kbps": metrics.bitrate_kbps,
+                "drop_rate_percent": drop_rate,
+                "viewer_count": metrics.viewer_count,
+                "latency_ms": metrics.get_latency_percentiles(),
+                # Same test as StreamDestination.is_healthy
+                "healthy": live and drop_rate <= 5.0 and metrics.bitrate_kbps >= 1000
+            }
 
         return {
-            "total_destinations": total_count,
-            "live_destinations": live_count,
+            "total_destinations": len(self.destinations),
+            "live_destinations": self._live_count,
             "is_streaming": self.is_streaming,
             "total_streams": self.total_streams,
             "total_stream_time_hours": self.total_stream_time_seconds / 3600,
-            "total_viewers": self.get_total_viewers(),
+            "total_viewers": total_viewers,
             "average_bitrate_kbps": self.get_average_bitrate(),
-            "destinations": {
-                dest.config.platform.value: {
-                    "status": dest.metrics.status.value,
-                    "uptime_seconds": dest.metrics.uptime_seconds,
-                    "fps": dest.metrics.fps,
-                    "bitrate_kbps": dest.metrics.bitrate_kbps,
-                    "drop_rate_percent": dest.metrics.get_drop_rate(),
-                    "viewer_count": dest.metrics.viewer_count,
-                    "healthy": dest.is_healthy() if dest.metrics.status == StreamStatus.LIVE else False
-                }
-                for dest in self.destinations
-            }
+            "destinations": destinations
         }
 
     def enable_destination(self, platform: StreamPlatform):
@@ -380,21 +518,42 @@ class AdaptiveBitrateManager:
         self.current_bitrate = max_bitrate
         self.target_bitrate = max_bitrate
 
+        # Smoothed network measurements; seeded by the first sample
+        self._alpha = 0.2
+        self._ewma_loss: Optional[float] = None
+        self._ewma_latency: Optional[float] = None
+
     def adjust_for_network(self, packet_loss: float, latency_ms: float):
         """
         Adjust bitrate based on network conditions
 
+        Decisions use exponentially weighted averages of the measurements, so a
+        single bad or good sample does not flip the bitrate, and increases stop
+        within a deadband of 15% of the current bitrate below the maximum.
+
         Args:
             packet_loss: Packet loss percentage (0-100)
             latency_ms: Latency in milliseconds
         """
+        alpha = self._alpha
+        if self._ewma_loss is None:
+            self._ewma_loss = packet_loss
+            self._ewma_latency = latency_ms
+        else:
+            self._ewma_loss += alpha * (packet_loss - self._ewma_loss)
+            self._ewma_latency += alpha * (latency_ms - self._ewma_latency)
+
+        loss = self._ewma_loss
+        latency = self._ewma_latency
+        delta_l = 0.15 * self.current_bitrate
+
         # Reduce bitrate if network issues detected
-        if packet_loss > 5.0 or latency_ms > 500:
+        if loss > 5.0 or latency > 500:
             self.target_bitrate = max(
                 self.min_bitrate,
                 self.target_bitrate * 0.8  # Reduce by 20%
             )
-        elif packet_loss < 1.0 and latency_ms < 100:
+        elif loss < 1.0 and latency < 100 and self.current_bitrate + delta_l < self.max_bitrate:
             # Increase bitrate if network is good
             self.target_bitrate = min(
                 self.max_bitrate,
@@ -402,8 +561,7 @@ class AdaptiveBitrateManager:
             )
 
         # Smooth transition
-        diff = self.target_bitrate - self.current_bitrate
-        self.current_bitrate += diff * 0.1  # 10% adjustment per step
+        self.current_bitrate += alpha * (self.target_bitrate - self.current_bitrate)
 
     def get_current_bitrate(self) -> float:
         """Get current bitrate"""
@@ -440,6 +598,10 @@ class StreamRecorder:
         self.recordings: Dict[str, Path] = {}
         self.is_recording = False
 
+        # Recorded files, so listing does not rescan the directory
+        self._known_recordings: Set[Path] = set()
+        self.refresh()
+
     def start_recording(self, session_id: str) -> Path:
         """
         Start recording a session
@@ -475,6 +637,7 @@ class StreamRecorder:
 
         if filepath:
             self.is_recording = False
+            self._known_recordings.add(filepath)
             print(f"⏹️  Recording stopped: {filepath.name}")
             return filepath
 
@@ -485,8 +648,12 @@ class StreamRecorder:
         return self.recordings.get(session_id)
 
     def list_recordings(self) -> List[Path]:
-        """List all recorded files"""
-        return list(self.output_dir.glob("debate_*.mp4"))
+        """List all recorded files (call refresh() to pick up external changes)"""
+        return list(self._known_recordings)
+
+    def refresh(self):
+        """Rescan the output directory for recordings added or removed by other tools"""
+        self._known_recordings = set(self.output_dir.glob("debate_*.mp4"))
 
     def get_recording_size_mb(self, session_id: str) -> float:
         """Get recording file size in MB"""
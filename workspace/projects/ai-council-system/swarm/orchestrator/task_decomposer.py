@@ -5,13 +5,21 @@ Analyzes complex tasks and decomposes them into smaller, manageable units
 that can be assigned to individual agents or agent groups.
 """
 
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from collections import OrderedDict
 from enum import Enum
+import asyncio
+import copy
+import itertools
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Interned so dependency type checks on the hot path compare by identity first
+_BLOCKS = sys.intern("blocks")
+
 
 class TaskType(Enum):
     """
@@ -24,6 +32,9 @@ class TaskType(Enum):
     DOCUMENTATION = "documentation"
     ARCHITECTURE = "architecture"
 
+    # Identity hash instead of Enum's Python-level hash of the member name
+    __hash__ = object.__hash__
+
 
 class TaskPriority(Enum):
     """
@@ -34,12 +45,17 @@ class TaskPriority(Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+    __hash__ = object.__hash__
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskDependency:
     """
     Represents a dependency between two tasks.
 
+    Instances are immutable, so copies of a decomposition share them rather
+    than duplicating each dependency.
+
     Attributes:
         task_id: The ID of the task that this task depends on.
         dependency_type: The type of dependency (e.g., "blocks", "requires", "suggests").
@@ -47,8 +63,14 @@ class TaskDependency:
     task_id: str
     dependency_type: str  # "blocks", "requires", "suggests"
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
-@dataclass
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a single, decomposed task.
@@ -75,24 +97,45 @@ class Task:
     dependencies: List[TaskDependency]
     acceptance_criteria: List[str]
     metadata: Dict[str, Any]
+    _pending_blockers: Set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._pending_blockers = {
+            dep.task_id for dep in self.dependencies if dep.dependency_type == _BLOCKS
+        }
+
+    def notify_completed(self, completed_task_id: str) -> None:
+        """
+        Records that a task has completed, resolving it as a blocker of this task.
 
-    def is_ready(self, completed_tasks: set) -> bool:
+        Args:
+            completed_task_id: The ID of the task that has completed.
+        """
+        self._pending_blockers.discard(completed_task_id)
+
+    def is_ready(self, completed_tasks: Optional[set] = None) -> bool:
         """
         Checks if the task is ready to be executed based on its dependencies.
 
+        Without arguments this is an O(1) check against the blockers resolved via
+        notify_completed(). Passing completed_tasks scans the dependencies instead.
+
         Args:
-            completed_tasks: A set of IDs of tasks that have already been completed.
+            completed_tasks: An optional set of IDs of tasks that have already been completed.
 
         Returns:
             True if the task is ready to be executed, False otherwise.
         """
+        if completed_tasks is None:
+            return not self._pending_blockers
+
         for dep in self.dependencies:
-            if dep.dependency_type == "blocks" and dep.task_id not in completed_tasks:
+            if dep.dependency_type == _BLOCKS and dep.task_id not in completed_tasks:
                 return False
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class DecompositionResult:
     """
     Contains the results of a task decomposition.
@@ -103,12 +146,120 @@ class DecompositionResult:
         execution_order: A list of lists, representing batches of tasks that can be executed in parallel.
         estimated_total_effort: The total estimated effort for all subtasks.
         critical_path: A list of task IDs representing the critical path of the decomposition.
+        children_by_id: Maps each task ID to the IDs of the tasks it blocks.
     """
     original_task: str
     subtasks: List[Task]
     execution_order: List[List[str]]  # List of task batches
     estimated_total_effort: int
     critical_path: List[str]
+    children_by_id: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+
+
+class _Phase(NamedTuple):
+    """A single phase of a strategy template."""
+    phase_id: str
+    title: str
+    capabilities: Tuple[str, ...]
+    effort: int
+    criterion: str
+
+
+class _TaskPool:
+    """
+    Free list of Task instances that can be reinitialized instead of allocated.
+
+    Used only by TaskDecomposer(use_pool=True); callers hand tasks back with
+    TaskDecomposer.release() once they no longer hold references to them.
+    """
+    __slots__ = ("_free", "max_size")
+
+    def __init__(self, max_size: int = 1024):
+        self._free: List[Task] = []
+        self.max_size = max_size
+
+    def acquire(self, **fields: Any) -> Task:
+        if not self._free:
+            return Task(**fields)
+        task = self._free.pop()
+        for name, value in fields.items():
+            setattr(task, name, value)
+        task.__post_init__()
+        return task
+
+    def release(self, tasks: List[Task]) -> None:
+        room = self.max_size - len(self._free)
+        if room > 0:
+            self._free.extend(tasks[:room])
+
+
+# Phase templates per strategy
+_DEVELOPMENT_PHASES = (
+    _Phase("design", "Design component architecture", ("architecture", "design"), 3, "Complete design component architecture"),
+    _Phase("implement", "Implement core functionality", ("coding", "development"), 5, "Complete implement core functionality"),
+    _Phase("test", "Write and execute tests", ("testing", "qa"), 3, "Complete write and execute tests"),
+    _Phase("integrate", "Integrate with existing system", ("integration", "development"), 2, "Complete integrate with existing system"),
+    _Phase("document", "Write documentation", ("documentation", "writing"), 2, "Complete write documentation"),
+)
+
+_RESEARCH_PHASES = (
+    _Phase("survey", "Literature survey", ("research", "analysis"), 2, "Complete literature survey"),
+    _Phase("collect", "Data collection", ("research", "data"), 3, "Complete data collection"),
+    _Phase("analyze", "Data analysis", ("analysis", "statistics"), 4, "Complete data analysis"),
+    _Phase("synthesize", "Synthesize findings", ("research", "writing"), 2, "Complete synthesize findings"),
+    _Phase("report", "Write research report", ("documentation", "writing"), 3, "Complete write research report"),
+)
+
+_ANALYSIS_PHASES = (
+    _Phase("scope", "Define analysis scope", ("analysis", "planning"), 2, "Complete define analysis scope"),
+    _Phase("gather", "Gather data/information", ("research", "data"), 3, "Complete gather data/information"),
+    _Phase("process", "Process and clean data", ("data", "analysis"), 3, "Complete process and clean data"),
+    _Phase("analyze", "Perform analysis", ("analysis", "statistics"), 4, "Complete perform analysis"),
+    _Phase("visualize", "Create visualizations", ("visualization", "data"), 2, "Complete create visualizations"),
+    _Phase("report", "Write analysis report", ("documentation", "writing"), 2, "Complete write analysis report"),
+)
+
+_TESTING_PHASES = (
+    _Phase("plan", "Create test plan", ("testing", "planning"), 2, "Complete create test plan"),
+    _Phase("unit", "Write unit tests", ("testing", "coding"), 3, "Complete write unit tests"),
+    _Phase("integration", "Write integration tests", ("testing", "coding"), 3, "Complete write integration tests"),
+    _Phase("e2e", "Write end-to-end tests", ("testing", "qa"), 2, "Complete write end-to-end tests"),
+    _Phase("execute", "Execute test suite", ("testing", "qa"), 2, "Complete execute test suite"),
+    _Phase("report", "Generate test report", ("documentation", "testing"), 1, "Complete generate test report"),
+)
+
+_DOCUMENTATION_PHASES = (
+    _Phase("outline", "Create documentation outline", ("documentation", "planning"), 1, "Complete create documentation outline"),
+    _Phase("draft", "Write first draft", ("documentation", "writing"), 3, "Complete write first draft"),
+    _Phase("review", "Review and refine", ("documentation", "editing"), 2, "Complete review and refine"),
+    _Phase("examples", "Add code examples", ("documentation", "coding"), 2, "Complete add code examples"),
+    _Phase("finalize", "Finalize documentation", ("documentation", "writing"), 1, "Complete finalize documentation"),
+)
+
+_ARCHITECTURE_PHASES = (
+    _Phase("requirements", "Gather requirements", ("architecture", "analysis"), 2, "Complete gather requirements"),
+    _Phase("design", "Design system architecture", ("architecture", "design"), 4, "Complete design system architecture"),
+    _Phase("document", "Document architecture", ("documentation", "architecture"), 3, "Complete document architecture"),
+    _Phase("review", "Architecture review", ("architecture", "review"), 2, "Complete architecture review"),
+    _Phase("refine", "Refine based on feedback", ("architecture", "design"), 2, "Complete refine based on feedback"),
+)
+
+# Bound ``str.format`` per known task ID prefix, e.g. "design" -> "design_{:04d}".format
+_TASK_ID_FORMATS = {
+    prefix: f"{prefix}_{{:04d}}".format
+    for prefix in ["default"] + [
+        phase[0]
+        for phases in (
+            _DEVELOPMENT_PHASES,
+            _RESEARCH_PHASES,
+            _ANALYSIS_PHASES,
+            _TESTING_PHASES,
+            _DOCUMENTATION_PHASES,
+            _ARCHITECTURE_PHASES,
+        )
+        for phase in phases
+    ]
+}
 
 
 class TaskDecomposer:
@@ -118,19 +269,20 @@ class TaskDecomposer:
     This class uses a strategy pattern to decompose tasks based on their type.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 0, use_pool: bool = False):
         """
         Initializes the TaskDecomposer.
+
+        Args:
+            cache_size: Maximum number of decomposition results to memoize. Off (0) by default:
+                a hit deep-copies the cached result, which costs more than recomputing the
+                built-in strategies and repeats the first request's task IDs.
+            use_pool: Reuse Task instances handed back through release() instead of allocating new ones.
         """
-        self.task_counter = 0
-        self.decomposition_strategies = {
-            TaskType.DEVELOPMENT: self._decompose_development_task,
-            TaskType.RESEARCH: self._decompose_research_task,
-            TaskType.ANALYSIS: self._decompose_analysis_task,
-            TaskType.TESTING: self._decompose_testing_task,
-            TaskType.DOCUMENTATION: self._decompose_documentation_task,
-            TaskType.ARCHITECTURE: self._decompose_architecture_task,
-        }
+        self._task_ids = itertools.count(1)
+        self._task_pool = _TaskPool() if use_pool else None
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple, DecompositionResult]" = OrderedDict()
 
     async def decompose_task(
         self,
@@ -141,6 +293,10 @@ class TaskDecomposer:
         """
         Decomposes a complex task into a set of smaller subtasks.
 
+        With cache_size > 0, results are memoized per (task type, description,
+        context). A repeated request then returns a copy of the cached result, so its task IDs are the
+        ones issued for the first request rather than freshly generated ones.
+
         Args:
             task_description: A high-level description of the task to be decomposed.
             task_type: The type of the task.
@@ -149,44 +305,111 @@ class TaskDecomposer:
         Returns:
             A DecompositionResult object containing the subtasks and execution plan.
         """
-        logger.info(f"Decomposing {task_type.value} task: {task_description}")
+        logger.info("Decomposing %s task: %s", task_type.value, task_description)
 
         context = context or {}
 
+        cache_key = self._make_cache_key(task_description, task_type, context)
+        if cache_key is not None and cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            return copy.deepcopy(self._cache[cache_key])
+
         # Select appropriate decomposition strategy
-        strategy = self.decomposition_strategies.get(task_type)
+        strategy = _STRATEGIES.get(task_type)
         if not strategy:
-            logger.warning(f"No strategy for task type: {task_type}")
+            logger.warning("No strategy for task type: %s", task_type)
             return self._default_decomposition(task_description, task_type)
 
         # Execute strategy
-        subtasks = await strategy(task_description, context)
-
-        # Build execution order based on dependencies
-        execution_order = self._build_execution_order(subtasks)
+        subtasks = strategy(self, task_description, context)
 
-        # Calculate critical path
-        critical_path = self._calculate_critical_path(subtasks, execution_order)
-
-        # Calculate total effort
-        total_effort = sum(task.estimated_effort for task in subtasks)
+        # Build execution order, critical path and total effort based on dependencies
+        execution_order, critical_path, total_effort, children_by_id = (
+            self._build_execution_order(subtasks)
+        )
 
         result = DecompositionResult(
             original_task=task_description,
             subtasks=subtasks,
             execution_order=execution_order,
             estimated_total_effort=total_effort,
-            critical_path=critical_path
+            critical_path=critical_path,
+            children_by_id=children_by_id
         )
 
         logger.info(
-            f"Decomposed into {len(subtasks)} subtasks, "
-            f"total effort: {total_effort}"
+            "Decomposed into %d subtasks, total effort: %d",
+            len(subtasks), total_effort
         )
 
+        if cache_key is not None and self.cache_size > 0:
+            self._cache[cache_key] = copy.deepcopy(result)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
         return result
 
-    async def _decompose_development_task(
+    async def decompose_many(
+        self,
+        requests: List[Tuple[str, TaskType, Optional[Dict[str, Any]]]]
+    ) -> List[DecompositionResult]:
+        """
+        Decomposes several independent tasks concurrently.
+
+        Each request is decomposed on its own; no dependencies are created between
+        subtasks of different requests. Task IDs come from the shared counter,
+        except that with caching enabled repeated requests are served from the
+        result cache and share the task IDs of their first occurrence.
+
+        Args:
+            requests: A list of (task_description, task_type, context) tuples.
+
+        Returns:
+            A list of DecompositionResult objects, in the same order as the requests.
+        """
+        return list(await asyncio.gather(*(
+            self.decompose_task(description, task_type, context)
+            for description, task_type, context in requests
+        )))
+
+    def release(self, result: DecompositionResult) -> None:
+        """
+        Returns a result's subtasks to the task pool for reuse.
+
+        Only has an effect when the decomposer was created with use_pool=True. The
+        caller must not use the released tasks afterwards.
+
+        Args:
+            result: A decomposition result the caller has finished with.
+        """
+        if self._task_pool is not None:
+            self._task_pool.release(result.subtasks)
+
+    def _make_cache_key(
+        self,
+        task_description: str,
+        task_type: TaskType,
+        context: Dict[str, Any]
+    ) -> Optional[tuple]:
+        """
+        Builds the memoization key for a decomposition request.
+
+        Args:
+            task_description: The description of the task.
+            task_type: The type of the task.
+            context: The context for the decomposition.
+
+        Returns:
+            A hashable key, or None if the context cannot be hashed.
+        """
+        try:
+            key = (task_type, task_description, tuple(sorted(context.items())))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _decompose_development_task(
         self,
         description: str,
         context: Dict[str, Any]
@@ -201,35 +424,15 @@ class TaskDecomposer:
         Returns:
             A list of decomposed tasks.
         """
-        subtasks = []
-
-        # Common development task breakdown
-        phases = [
-            ("design", "Design component architecture", ["architecture", "design"], 3),
-            ("implement", "Implement core functionality", ["coding", "development"], 5),
-            ("test", "Write and execute tests", ["testing", "qa"], 3),
-            ("integrate", "Integrate with existing system", ["integration", "development"], 2),
-            ("document", "Write documentation", ["documentation", "writing"], 2),
-        ]
-
-        for i, (phase_id, title, capabilities, effort) in enumerate(phases):
-            task = Task(
-                task_id=self._generate_task_id(phase_id),
-                title=f"{title}: {description}",
-                description=f"{title} phase of: {description}",
-                task_type=TaskType.DEVELOPMENT,
-                priority=TaskPriority.HIGH,
-                estimated_effort=effort,
-                required_capabilities=capabilities,
-                dependencies=self._create_sequential_dependencies(i, phases),
-                acceptance_criteria=[f"Complete {title.lower()}"],
-                metadata={"phase": phase_id}
-            )
-            subtasks.append(task)
-
-        return subtasks
+        return self._build_phase_tasks(
+            description,
+            phases=_DEVELOPMENT_PHASES,
+            description_template="{title} phase of: {description}",
+            task_type=TaskType.DEVELOPMENT,
+            priority=TaskPriority.HIGH
+        )
 
-    async def _decompose_research_task(
+    def _decompose_research_task(
         self,
         description: str,
         context: Dict[str, Any]
@@ -244,34 +447,15 @@ class TaskDecomposer:
         Returns:
             A list of decomposed tasks.
         """
-        subtasks = []
-
-        research_phases = [
-            ("survey", "Literature survey", ["research", "analysis"], 2),
-            ("collect", "Data collection", ["research", "data"], 3),
-            ("analyze", "Data analysis", ["analysis", "statistics"], 4),
-            ("synthesize", "Synthesize findings", ["research", "writing"], 2),
-            ("report", "Write research report", ["documentation", "writing"], 3),
-        ]
-
-        for i, (phase_id, title, capabilities, effort) in enumerate(research_phases):
-            task = Task(
-                task_id=self._generate_task_id(phase_id),
-                title=f"{title}: {description}",
-                description=f"{title} for research task: {description}",
-                task_type=TaskType.RESEARCH,
-                priority=TaskPriority.MEDIUM,
-                estimated_effort=effort,
-                required_capabilities=capabilities,
-                dependencies=self._create_sequential_dependencies(i, research_phases),
-                acceptance_criteria=[f"Complete {title.lower()}"],
-                metadata={"phase": phase_id}
-            )
-            subtasks.append(task)
-
-        return subtasks
+        return self._build_phase_tasks(
+            description,
+            phases=_RESEARCH_PHASES,
+            description_template="{title} for research task: {description}",
+            task_type=TaskType.RESEARCH,
+            priority=TaskPriority.MEDIUM
+        )
 
-    async def _decompose_analysis_task(
+    def _decompose_analysis_task(
         self,
         description: str,
         context: Dict[str, Any]
@@ -286,35 +470,15 @@ class TaskDecomposer:
         Returns:
             A list of decomposed tasks.
         """
-        subtasks = []
-
-        analysis_phases = [
-            ("scope", "Define analysis scope", ["analysis", "planning"], 2),
-            ("gather", "Gather data/information", ["research", "data"], 3),
-            ("process", "Process and clean data", ["data", "analysis"], 3),
-            ("analyze", "Perform analysis", ["analysis", "statistics"], 4),
-            ("visualize", "Create visualizations", ["visualization", "data"], 2),
-            ("report", "Write analysis report", ["documentation", "writing"], 2),
-        ]
-
-        for i, (phase_id, title, capabilities, effort) in enumerate(analysis_phases):
-            task = Task(
-                task_id=self._generate_task_id(phase_id),
-                title=f"{title}: {description}",
-                description=f"{title} for: {description}",
-                task_type=TaskType.ANALYSIS,
-                priority=TaskPriority.MEDIUM,
-                estimated_effort=effort,
-                required_capabilities=capabilities,
-                dependencies=self._create_sequential_dependencies(i, analysis_phases),
-                acceptance_criteria=[f"Complete {title.lower()}"],
-                metadata={"phase": phase_id}
-            )
-            subtasks.append(task)
-
-        return subtasks
+        return self._build_phase_tasks(
+            description,
+            phases=_ANALYSIS_PHASES,
+            description_template="{title} for: {description}",
+            task_type=TaskType.ANALYSIS,
+            priority=TaskPriority.MEDIUM
+        )
 
-    async def _decompose_testing_task(
+    def _decompose_testing_task(
         self,
         description: str,
         context: Dict[str, Any]
@@ -329,35 +493,15 @@ class TaskDecomposer:
         Returns:
             A list of decomposed tasks.
         """
-        subtasks = []
-
-        testing_phases = [
-            ("plan", "Create test plan", ["testing", "planning"], 2),
-            ("unit", "Write unit tests", ["testing", "coding"], 3),
-            ("integration", "Write integration tests", ["testing", "coding"], 3),
-            ("e2e", "Write end-to-end tests", ["testing", "qa"], 2),
-            ("execute", "Execute test suite", ["testing", "qa"], 2),
-            ("report", "Generate test report", ["documentation", "testing"], 1),
-        ]
-
-        for i, (phase_id, title, capabilities, effort) in enumerate(testing_phases):
-            task = Task(
-                task_id=self._generate_task_id(phase_id),
-                title=f"{title}: {description}",
-                description=f"{title} for: {description}",
-                task_type=TaskType.TESTING,
-                priority=TaskPriority.HIGH,
-                estimated_effort=effort,
-                required_capabilities=capabilities,
-                dependencies=self._create_sequential_dependencies(i, testing_phases),
-                acceptance_criteria=[f"Complete {title.lower()}"],
-                metadata={"phase": phase_id}
-            )
-            subtasks.append(task)
-
-        return subtasks
+        return self._build_phase_tasks(
+            description,
+            phases=_TESTING_PHASES,
+            description_template="{title} for: {description}",
+            task_type=TaskType.TESTING,
+            priority=TaskPriority.HIGH
+        )
 
-    async def _decompose_documentation_task(
+    def _decompose_documentation_task(
         self,
         description: str,
         context: Dict[str, Any]
@@ -372,34 +516,15 @@ class TaskDecomposer:
         Returns:
             A list of decomposed tasks.
         """
-        subtasks = []
-
-        doc_phases = [
-            ("outline", "Create documentation outline", ["documentation", "planning"], 1),
-            ("draft", "Write first draft", ["documentation", "writing"], 3),
-            ("review", "Review and refine", ["documentation", "editing"], 2),
-            ("examples", "Add code examples", ["documentation", "coding"], 2),
-            ("finalize", "Finalize documentation", ["documentation", "writing"], 1),
-        ]
-
-        for i, (phase_id, title, capabilities, effort) in enumerate(doc_phases):
-            task = Task(
-                task_id=self._generate_task_id(phase_id),
-                title=f"{title}: {description}",
-                description=f"{title} for: {description}",
-                task_type=TaskType.DOCUMENTATION,
-                priority=TaskPriority.MEDIUM,
-                estimated_effort=effort,
-                required_capabilities=capabilities,
-                dependencies=self._create_sequential_dependencies(i, doc_phases),
-                acceptance_criteria=[f"Complete {title.lower()}"],
-                metadata={"phase": phase_id}
-            )
-            subtasks.append(task)
-
-        return subtasks
+        return self._build_phase_tasks(
+            description,
+            phases=_DOCUMENTATION_PHASES,
+            description_template="{title} for: {description}",
+            task_type=TaskType.DOCUMENTATION,
+            priority=TaskPriority.MEDIUM
+        )
 
-    async def _decompose_architecture_task(
+    def _decompose_architecture_task(
         self,
         description: str,
         context: Dict[str, Any]
@@ -414,32 +539,61 @@ class TaskDecomposer:
         Returns:
             A list of decomposed tasks.
         """
-        subtasks = []
+        return self._build_phase_tasks(
+            description,
+            phases=_ARCHITECTURE_PHASES,
+            description_template="{title} for: {description}",
+            task_type=TaskType.ARCHITECTURE,
+            priority=TaskPriority.CRITICAL
+        )
 
-        arch_phases = [
-            ("requirements", "Gather requirements", ["architecture", "analysis"], 2),
-            ("design", "Design system architecture", ["architecture", "design"], 4),
-            ("document", "Document architecture", ["documentation", "architecture"], 3),
-            ("review", "Architecture review", ["architecture", "review"], 2),
-            ("refine", "Refine based on feedback", ["architecture", "design"], 2),
+    def _build_phase_tasks(
+        self,
+        description: str,
+        phases: Tuple[_Phase, ...],
+        description_template: str,
+        task_type: TaskType,
+        priority: TaskPriority
+    ) -> List[Task]:
+        """
+        Builds a sequential chain of subtasks from a phase template.
+
+        Args:
+            description: The description of the task being decomposed.
+            phases: The phase template for the strategy.
+            description_template: Format string for each subtask description.
+            task_type: The type shared by all subtasks.
+            priority: The priority shared by all subtasks.
+
+        Returns:
+            A list of decomposed tasks, each blocked by the previous one.
+        """
+        task_ids = [self._generate_task_id(phase[0]) for phase in phases]
+        # Sized up front; every phase but the first is blocked by its predecessor
+        dependencies: List[List[TaskDependency]] = [[]] * len(task_ids)
+        dependencies[1:] = [
+            [TaskDependency(task_id=task_id, dependency_type=_BLOCKS)]
+            for task_id in task_ids[:-1]
         ]
 
-        for i, (phase_id, title, capabilities, effort) in enumerate(arch_phases):
-            task = Task(
-                task_id=self._generate_task_id(phase_id),
+        make_task = self._task_pool.acquire if self._task_pool is not None else Task
+
+        return [
+            make_task(
+                task_id=task_id,
                 title=f"{title}: {description}",
-                description=f"{title} for: {description}",
-                task_type=TaskType.ARCHITECTURE,
-                priority=TaskPriority.CRITICAL,
+                description=description_template.format(title=title, description=description),
+                task_type=task_type,
+                priority=priority,
                 estimated_effort=effort,
-                required_capabilities=capabilities,
-                dependencies=self._create_sequential_dependencies(i, arch_phases),
-                acceptance_criteria=[f"Complete {title.lower()}"],
+                required_capabilities=list(capabilities),
+                dependencies=task_dependencies,
+                acceptance_criteria=[criterion],
                 metadata={"phase": phase_id}
             )
-            subtasks.append(task)
-
-        return subtasks
+            for task_id, task_dependencies, (phase_id, title, capabilities, effort, criterion)
+            in zip(task_ids, dependencies, phases)
+        ]
 
     def _default_decomposition(
         self,
@@ -474,91 +628,64 @@ class TaskDecomposer:
             subtasks=[task],
             execution_order=[[task.task_id]],
             estimated_total_effort=5,
-            critical_path=[task.task_id]
+            critical_path=[task.task_id],
+            children_by_id={task.task_id: ()}
         )
 
-    def _build_execution_order(self, subtasks: List[Task]) -> List[List[str]]:
-        """
-        Builds an execution order for a list of subtasks, respecting their dependencies.
-
-        Args:
-            subtasks: A list of tasks to be ordered.
-
-        Returns:
-            A list of lists, where each inner list represents a batch of tasks that can be executed in parallel.
-        """
-        completed = set()
-        execution_order = []
-
-        while len(completed) < len(subtasks):
-            # Find tasks that can be executed (all dependencies met)
-            batch = []
-            for task in subtasks:
-                if task.task_id not in completed and task.is_ready(completed):
-                    batch.append(task.task_id)
-
-            if not batch:
-                # Circular dependency or error
-                logger.error("Cannot determine execution order - circular dependency?")
-                break
-
-            execution_order.append(batch)
-            completed.update(batch)
-
-        return execution_order
-
-    def _calculate_critical_path(
+    def _build_execution_order(
         self,
-        subtasks: List[Task],
-        execution_order: List[List[str]]
-    ) -> List[str]:
-        """
-        Calculates the critical path for a set of tasks.
-
-        Note: This is a simplified implementation that takes the longest task from each batch.
-
-        Args:
-            subtasks: A list of all subtasks.
-            execution_order: The execution order of the tasks.
-
-        Returns:
-            A list of task IDs representing the critical path.
+        subtasks: List[Task]
+    ) -> Tuple[List[List[str]], List[str], int, Dict[str, Tuple[str, ...]]]:
         """
-        path = []
-        for batch in execution_order:
-            # Find task with highest effort in each batch
-            batch_tasks = [t for t in subtasks if t.task_id in batch]
-            if batch_tasks:
-                longest = max(batch_tasks, key=lambda t: t.estimated_effort)
-                path.append(longest.task_id)
-
-        return path
+        Builds the execution plan for a list of subtasks.
 
-    def _create_sequential_dependencies(
-        self,
-        current_index: int,
-        phases: List[tuple]
-    ) -> List[TaskDependency]:
-        """
-        Creates a sequential dependency on the previous phase.
+        Uses Kahn's algorithm to peel the dependency graph into parallel batches,
+        relaxing each "blocks" edge on the way so the longest effort-weighted
+        path falls out of the same pass.
 
         Args:
-            current_index: The index of the current phase.
-            phases: A list of all phases.
+            subtasks: A list of tasks to be ordered.
 
         Returns:
-            A list containing a single dependency on the previous phase, or an empty list if this is the first phase.
+            A tuple of (execution_order, critical_path, total_effort, children_by_id), where
+            execution_order is a list of batches of task IDs that can be executed in parallel,
+            critical_path is the list of task IDs along the longest effort-weighted dependency
+            chain, total_effort is the summed estimated effort of all subtasks, and
+            children_by_id maps each task ID to the IDs of the tasks it blocks.
         """
-        if current_index == 0:
-            return []
+        # Work on positional indices internally; task IDs only appear at the boundary
+        task_ids = [task.task_id for task in subtasks]
+        index_of = {task_id: i for i, task_id in enumerate(task_ids)}
+        in_degree = [0] * len(subtasks)
+        children: List[List[int]] = [[] for _ in subtasks]
+        effort = [0] * len(subtasks)
+        total_effort = 0
+
+        for i, task in enumerate(subtasks):
+            effort[i] = task.estimated_effort
+            total_effort += task.estimated_effort
+            for dep in task.dependencies:
+                if dep.dependency_type == _BLOCKS:
+                    # A blocker outside this decomposition is never resolved
+                    j = index_of.get(dep.task_id)
+                    if j is not None:
+                        children[j].append(i)
+                    in_degree[i] += 1
+
+        levels, critical = _topo_levels(in_degree, children, effort)
+
+        if any(in_degree):
+            # Circular dependency or dependency on an unknown task
+            logger.error("Cannot determine execution order - circular dependency?")
+
+        execution_order = [[task_ids[i] for i in level] for level in levels]
+        critical_path = [task_ids[i] for i in critical]
+        children_by_id = {
+            task_id: tuple(task_ids[i] for i in children[j])
+            for j, task_id in enumerate(task_ids)
+        }
 
-        prev_phase_id = phases[current_index - 1][0]
-        return [
-            TaskDependency(
-                task_id=self._generate_task_id(prev_phase_id),
-                dependency_type="blocks"
-            )
-        ]
+        return execution_order, critical_path, total_effort, children_by_id
 
     def _generate_task_id(self, prefix: str) -> str:
         """
@@ -570,5 +697,70 @@ class TaskDecomposer:
         Returns:
             A unique task ID string.
         """
-        self.task_counter += 1
-        return f"{prefix}_{self.task_counter:04d}"
+        id_format = _TASK_ID_FORMATS.get(prefix)
+        if id_format is None:
+            id_format = _TASK_ID_FORMATS[prefix] = f"{prefix}_{{:04d}}".format
+        return id_format(next(self._task_ids))
+
+
+def _topo_levels(
+    in_degree: List[int],
+    children: List[List[int]],
+    effort: List[int]
+) -> Tuple[List[List[int]], List[int]]:
+    """
+    Kahn's algorithm with longest-path relaxation over an index-based DAG.
+
+    Only touches ints and lists of ints so it can be swapped for a compiled
+    kernel without changing callers. Consumes in_degree: entries still
+    non-zero on return belong to tasks that could not be scheduled.
+
+    Args:
+        in_degree: Number of unresolved blockers per task.
+        children: Indices of the tasks each task blocks.
+        effort: Estimated effort per task.
+
+    Returns:
+        A tuple of (levels, critical_path) as lists of task indices.
+    """
+    finish = effort[:]
+    parent = [-1] * len(effort)
+    levels = []
+    current = [i for i, degree in enumerate(in_degree) if degree == 0]
+    end = -1
+
+    while current:
+        levels.append(current)
+        next_level = []
+        for i in current:
+            if end < 0 or finish[i] > finish[end]:
+                end = i
+            for child in children[i]:
+                # Relax the edge: the child finishes after its slowest blocker
+                candidate = finish[i] + effort[child]
+                if candidate > finish[child]:
+                    finish[child] = candidate
+                    parent[child] = i
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    next_level.append(child)
+        current = next_level
+
+    critical_path = []
+    while end >= 0:
+        critical_path.append(end)
+        end = parent[end]
+    critical_path.reverse()
+
+    return levels, critical_path
+
+
+# Strategy dispatch table, shared by all TaskDecomposer instances
+_STRATEGIES: Dict[TaskType, Callable[[TaskDecomposer, str, Dict[str, Any]], List[Task]]] = {
+    TaskType.DEVELOPMENT: TaskDecomposer._decompose_development_task,
+    TaskType.RESEARCH: TaskDecomposer._decompose_research_task,
+    TaskType.ANALYSIS: TaskDecomposer._decompose_analysis_task,
+    TaskType.TESTING: TaskDecomposer._decompose_testing_task,
+    TaskType.DOCUMENTATION: TaskDecomposer._decompose_documentation_task,
+    TaskType.ARCHITECTURE: TaskDecomposer._decompose_architecture_task,
+}
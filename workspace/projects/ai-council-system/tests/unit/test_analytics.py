@@ -0,0 +1,213 @@
+"""
+Unit tests for the analytics dashboard
+
+Author: AI Council System
+Version: 2.0.0
+"""
+
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+from automation.analytics import (
+    AnalyticsDashboard,
+    DebateMetrics,
+    StreamingMetrics,
+    SystemMetrics,
+)
+
+_TOPIC_WORDS = ["climate", "crypto", "policy", "markets", "energy", "the", "on"]
+
+
+def _random_debate(rng: random.Random, now: datetime, i: int) -> DebateMetrics:
+    return DebateMetrics(
+        debate_id=f"d{i}",
+        start_time=now - timedelta(hours=rng.uniform(0.01, 240)),
+        duration_seconds=rng.uniform(300, 3600),
+        topic=" ".join(rng.sample(_TOPIC_WORDS, 3)),
+        participant_count=rng.randrange(2, 9),
+        round_count=rng.randrange(1, 6),
+        viewer_count_peak=rng.randrange(0, 5000),
+        engagement_score=rng.random(),
+        consensus_level=rng.random(),
+        controversy_score=rng.random()
+    )
+
+
+def _random_stream(rng: random.Random, now: datetime, i: int) -> StreamingMetrics:
+    start = now - timedelta(hours=rng.uniform(0.01, 240))
+    return StreamingMetrics(
+        session_id=f"s{i}",
+        start_time=start,
+        end_time=start + timedelta(minutes=rng.uniform(1, 120)) if rng.random() < 0.8 else None,
+        platforms=rng.sample(["youtube", "twitch", "facebook"], rng.randrange(1, 3)),
+        total_viewers_peak=rng.randrange(0, 5000),
+        avg_bitrate_kbps=rng.uniform(1000, 6000),
+        uptime_percent=rng.uniform(90, 100)
+    )
+
+
+def _reference_debate_statistics(debates, days):
+    """The original list-filter implementation"""
+    cutoff = datetime.now() - timedelta(days=days)
+    recent = [d for d in debates if d.start_time >= cutoff]
+    n = len(recent)
+    return {
+        "total_debates": n,
+        "avg_duration_minutes": sum(d.duration_seconds for d in recent) / n / 60,
+        "avg_participants": sum(d.participant_count for d in recent) / n,
+        "avg_rounds": sum(d.round_count for d in recent) / n,
+        "avg_engagement": sum(d.engagement_score for d in recent) / n,
+        "avg_controversy": sum(d.controversy_score for d in recent) / n,
+        "avg_consensus": sum(d.consensus_level for d in recent) / n,
+        "peak_viewers": max((d.viewer_count_peak for d in recent), default=0),
+        "debates_per_day": n / days
+    }
+
+
+def _reference_engagement_trends(debates, days):
+    cutoff = datetime.now() - timedelta(days=days)
+    daily = defaultdict(list)
+    for debate in debates:
+        if debate.start_time >= cutoff:
+            daily[debate.start_time.date()].append(debate.engagement_score)
+    return [
+        {"date": day.isoformat(), "avg_engagement": sum(s) / len(s), "debate_count": len(s)}
+        for day, s in sorted(daily.items())
+    ]
+
+
+def _reference_topic_trends(debates, days):
+    cutoff = datetime.now() - timedelta(days=days)
+    counts = defaultdict(int)
+    for debate in debates:
+        if debate.start_time >= cutoff and debate.topic:
+            for word in debate.topic.lower().split():
+                if len(word) > 4:
+                    counts[word] += 1
+    return dict(counts)
+
+
+def _assert_close(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        assert actual[key] == pytest.approx(value), key
+
+
+class TestWindowedStatistics:
+    """Test the column-store statistics against the original list scans"""
+
+    @pytest.fixture
+    def populated(self):
+        rng = random.Random(99)
+        now = datetime.now()
+        dashboard = AnalyticsDashboard()
+        # Out-of-order arrivals exercise the sorted insert
+        debates = [_random_debate(rng, now, i) for i in range(300)]
+        streams = [_random_stream(rng, now, i) for i in range(120)]
+        dashboard.record_batch(debates + streams)
+        return dashboard, debates, streams
+
+    @pytest.mark.parametrize("days", [1, 3, 7, 30])
+    def test_debate_statistics(self, populated, days):
+        dashboard, debates, _ = populated
+        _assert_close(dashboard.get_debate_statistics(days), _reference_debate_statistics(debates, days))
+
+    @pytest.mark.parametrize("days", [1, 7])
+    def test_streaming_statistics(self, populated, days):
+        dashboard, _, streams = populated
+        cutoff = datetime.now() - timedelta(days=days)
+        recent = [s for s in streams if s.start_time >= cutoff]
+        stats = dashboard.get_streaming_statistics(days)
+
+        assert stats["total_streams"] == len(recent)
+        assert stats["total_hours"] == pytest.approx(sum(
+            (s.end_time - s.start_time).total_seconds() / 3600 for s in recent if s.end_time
+        ))
+        assert stats["avg_viewers"] == pytest.approx(sum(s.total_viewers_peak for s in recent) / len(recent))
+        assert stats["total_viewers_peak"] == max(s.total_viewers_peak for s in recent)
+        assert stats["avg_uptime"] == pytest.approx(sum(s.uptime_percent for s in recent) / len(recent))
+        assert sorted(stats["platforms_used"]) == sorted({p for s in recent for p in s.platforms})
+
+    @pytest.mark.parametrize("days", [2, 7])
+    def test_engagement_and_topic_trends(self, populated, days):
+        dashboard, debates, _ = populated
+
+        trends = dashboard.get_engagement_trends(days)
+        expected = _reference_engagement_trends(debates, days)
+        assert [t["date"] for t in trends] == [t["date"] for t in expected]
+        assert [t["debate_count"] for t in trends] == [t["debate_count"] for t in expected]
+        assert [t["avg_engagement"] for t in trends] == pytest.approx([t["avg_engagement"] for t in expected])
+
+        assert dashboard.get_topic_trends(days) == _reference_topic_trends(debates, days)
+
+    def test_memoized_results_refresh_after_recording(self, populated):
+        dashboard, debates, _ = populated
+        before = dashboard.get_debate_statistics(1)["total_debates"]
+
+        dashboard.record_debate(DebateMetrics(debate_id="new", start_time=datetime.now()))
+
+        assert dashboard.get_debate_statistics(1)["total_debates"] == before + 1
+
+
+class TestSystemWindow:
+    """Test the rolling system-metrics window"""
+
+    def test_matches_last_hundred_samples(self):
+        """Test running sums and sliding peaks equal a rescan of the last 100"""
+        rng = random.Random(5)
+        dashboard = AnalyticsDashboard(system_sample_seconds=60)
+        start = datetime.now() - timedelta(hours=23)
+        samples = []
+
+        for i in range(450):
+            sample = SystemMetrics(
+                timestamp=start + timedelta(minutes=i),
+                cpu_usage_percent=rng.uniform(0, 100),
+                memory_usage_percent=rng.uniform(0, 100),
+                disk_usage_percent=rng.uniform(0, 100),
+                network_in_mbps=rng.uniform(0, 50),
+                network_out_mbps=rng.uniform(0, 50),
+                active_debates=rng.randrange(0, 3)
+            )
+            samples.append(sample)
+            dashboard.record_system(sample)
+
+            recent = samples[-100:]
+            stats = dashboard.get_system_statistics()
+            assert stats["avg_cpu"] == pytest.approx(sum(m.cpu_usage_percent for m in recent) / len(recent))
+            assert stats["avg_network_out"] == pytest.approx(sum(m.network_out_mbps for m in recent) / len(recent))
+            assert stats["peak_cpu"] == max(m.cpu_usage_percent for m in recent)
+            assert stats["peak_memory"] == max(m.memory_usage_percent for m in recent)
+            assert stats["current_active_debates"] == sample.active_debates
+
+    def test_expired_samples_leave_the_window(self):
+        """Test samples older than 24 hours are dropped from the statistics"""
+        dashboard = AnalyticsDashboard()
+        now = datetime.now()
+        dashboard.record_system(SystemMetrics(timestamp=now - timedelta(hours=30), cpu_usage_percent=90))
+        dashboard.record_system(SystemMetrics(timestamp=now, cpu_usage_percent=10))
+
+        stats = dashboard.get_system_statistics()
+        assert len(dashboard.system_metrics) == 1
+        assert stats["avg_cpu"] == pytest.approx(10)
+        assert stats["peak_cpu"] == 10
+
+
+class TestBufferedWrites:
+    """Test batched JSONL persistence"""
+
+    @pytest.mark.asyncio
+    async def test_aclose_writes_everything_buffered(self, tmp_path):
+        """Test lines still buffered at shutdown reach disk, in order"""
+        dashboard = AnalyticsDashboard(tmp_path)
+        now = datetime.now()
+        for i in range(250):
+            dashboard.record_debate(DebateMetrics(debate_id=f"d{i}", start_time=now))
+
+        await dashboard.aclose()
+
+        lines = [line for path in tmp_path.iterdir() for line in path.read_text().splitlines()]
+        assert [f'"d{i}"' in line for i, line in enumerate(lines)] == [True] * 250
+        assert not dashboard._write_tasks
@@ -0,0 +1,154 @@
+"""
+Unit tests for the automation orchestrator
+
+Author: AI Council System
+Version: 2.0.0
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from automation.monitoring import Alert, AlertSeverity
+from automation.orchestrator import (
+    AutomationOrchestrator,
+    OrchestratorConfig,
+    SystemState,
+)
+
+
+def _make_orchestrator(**overrides) -> AutomationOrchestrator:
+    """Build an orchestrator with only the scheduler and analytics enabled"""
+    config = OrchestratorConfig(
+        enable_streaming=False,
+        enable_health_monitoring=False,
+        auto_start_debates=False,
+        **overrides
+    )
+    return AutomationOrchestrator(config)
+
+
+def _alert(alert_id: str, severity: AlertSeverity = AlertSeverity.CRITICAL) -> Alert:
+    return Alert(
+        alert_id=alert_id,
+        severity=severity,
+        component="test",
+        message=alert_id,
+        timestamp=datetime.now()
+    )
+
+
+class TestLifecycle:
+    """Test the orchestrator lifecycle state machine"""
+
+    @pytest.mark.asyncio
+    async def test_initialize_leaves_orchestrator_stopped(self):
+        """Test initialize() moves INITIALIZING to STOPPED"""
+        orchestrator = _make_orchestrator()
+        assert orchestrator.state == SystemState.INITIALIZING
+
+        await orchestrator.initialize()
+
+        assert orchestrator.state == SystemState.STOPPED
+        assert orchestrator.stats.current_state == SystemState.STOPPED
+
+    @pytest.mark.asyncio
+    async def test_pause_and_resume_only_while_running(self):
+        """Test pause/resume are ignored outside RUNNING/PAUSED"""
+        orchestrator = _make_orchestrator()
+        await orchestrator.initialize()
+
+        await orchestrator.pause()
+        assert orchestrator.state == SystemState.STOPPED
+        await orchestrator.resume()
+        assert orchestrator.state == SystemState.STOPPED
+
+        runner = asyncio.create_task(orchestrator.start())
+        await asyncio.sleep(0)
+        assert orchestrator.state == SystemState.RUNNING
+
+        await orchestrator.pause()
+        assert orchestrator.state == SystemState.PAUSED
+
+        # A second start while paused is rejected rather than restarting loops
+        await orchestrator.start()
+        assert orchestrator.state == SystemState.PAUSED
+
+        await orchestrator.resume()
+        assert orchestrator.state == SystemState.RUNNING
+        assert orchestrator.get_status()["state"] == "running"
+
+        await orchestrator.stop()
+        await asyncio.wait_for(runner, timeout=2)
+        assert orchestrator.state == SystemState.STOPPED
+        assert orchestrator.stats.current_state == SystemState.STOPPED
+
+    @pytest.mark.asyncio
+    async def test_stop_from_paused(self):
+        """Test stop() is accepted from PAUSED and ends the run loops"""
+        orchestrator = _make_orchestrator()
+        await orchestrator.initialize()
+
+        runner = asyncio.create_task(orchestrator.start())
+        await asyncio.sleep(0)
+        await orchestrator.pause()
+        await orchestrator.stop()
+        await asyncio.wait_for(runner, timeout=2)
+
+        assert orchestrator.state == SystemState.STOPPED
+        assert not orchestrator.running
+
+    def test_rejects_non_positive_cleanup_interval(self):
+        """Test a zero cleanup interval is refused up front"""
+        with pytest.raises(ValueError):
+            _make_orchestrator(cleanup_interval_hours=0)
+
+
+class TestCriticalAlerts:
+    """Test grouped delivery of critical alerts"""
+
+    @pytest.mark.asyncio
+    async def test_alerts_in_one_tick_are_grouped(self):
+        """Test critical alerts raised together reach the callback as one list"""
+        orchestrator = _make_orchestrator()
+        delivered = []
+
+        async def on_critical(alerts):
+            delivered.append([alert.alert_id for alert in alerts])
+
+        orchestrator.on_critical_alert = on_critical
+
+        await orchestrator._handle_alert(_alert("a"))
+        await orchestrator._handle_alert(_alert("w", AlertSeverity.WARNING))
+        await orchestrator._handle_alert(_alert("b"))
+        await asyncio.sleep(0.01)
+
+        await orchestrator._handle_alert(_alert("c"))
+        await asyncio.sleep(0.01)
+
+        assert delivered == [["a", "b"], ["c"]]
+        assert not orchestrator._callback_tasks
+        assert orchestrator._critical_flush_task is None
+
+    @pytest.mark.asyncio
+    async def test_alerts_during_callback_start_a_new_group(self):
+        """Test an alert raised while the callback runs is not lost"""
+        orchestrator = _make_orchestrator()
+        delivered = []
+        release = asyncio.Event()
+
+        async def on_critical(alerts):
+            delivered.append([alert.alert_id for alert in alerts])
+            await release.wait()
+
+        orchestrator.on_critical_alert = on_critical
+
+        await orchestrator._handle_alert(_alert("a"))
+        await asyncio.sleep(0)
+        await orchestrator._handle_alert(_alert("b"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert delivered == [["a"], ["b"]]
+        assert not orchestrator._callback_tasks
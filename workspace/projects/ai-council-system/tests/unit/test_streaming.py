@@ -0,0 +1,157 @@
+"""
+Unit tests for the multi-platform streamer
+
+Author: AI Council System
+Version: 2.0.0
+"""
+
+import asyncio
+import types
+
+import numpy as np
+import pytest
+from automation import streaming
+from automation.streaming import (
+    MultiPlatformStreamer,
+    StreamConfig,
+    StreamMetrics,
+    StreamPlatform,
+    StreamQuality,
+    StreamStatus,
+)
+
+_real_sleep = asyncio.sleep
+
+
+@pytest.fixture
+def fast_connect(monkeypatch):
+    """Make the simulated 2s connect near-instant; returns a failure counter"""
+    failures = {"remaining": 0}
+
+    async def sleep(delay):
+        if delay == 2 and failures["remaining"]:
+            failures["remaining"] -= 1
+            raise ConnectionError("connect failed")
+        await _real_sleep(0 if delay != 1 else 0.01)
+
+    fake = types.SimpleNamespace(**vars(asyncio))
+    fake.sleep = sleep
+    monkeypatch.setattr(streaming, "asyncio", fake)
+    return failures
+
+
+def _streamer(*platforms, **config) -> MultiPlatformStreamer:
+    streamer = MultiPlatformStreamer()
+    for platform in platforms:
+        streamer.add_destination(StreamConfig(
+            platform=platform, stream_key="key", rtmp_url="rtmp://example", **config
+        ))
+    return streamer
+
+
+class TestMetrics:
+    """Test per-destination metrics"""
+
+    def test_drop_rate_reads_counters(self):
+        """Test the drop rate follows the frame counters directly"""
+        metrics = StreamMetrics(StreamPlatform.YOUTUBE, StreamStatus.LIVE, dropped_frames=10, total_frames=100)
+        assert metrics.get_drop_rate() == 10.0
+
+        metrics.dropped_frames = 0
+        assert metrics.get_drop_rate() == 0.0
+
+    def test_latency_window_and_percentiles(self):
+        """Test the latency history is bounded and percentiles use the window"""
+        metrics = StreamMetrics(StreamPlatform.YOUTUBE, StreamStatus.LIVE)
+        assert metrics.get_latency_percentiles() == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+        for value in range(1000):
+            metrics.latency_samples.append(float(value))
+
+        window = np.arange(1000 - streaming._LATENCY_WINDOW, 1000, dtype=float)
+        percentiles = metrics.get_latency_percentiles()
+        assert len(metrics.latency_samples) == streaming._LATENCY_WINDOW
+        assert percentiles["p50"] == pytest.approx(np.percentile(window, 50))
+        assert percentiles["p95"] == pytest.approx(np.percentile(window, 95))
+        assert percentiles["p99"] == pytest.approx(np.percentile(window, 99))
+
+
+class TestStreaming:
+    """Test starting, retrying and stopping destinations"""
+
+    @pytest.mark.asyncio
+    async def test_live_aggregates_match_scan(self, fast_connect):
+        """Test the running bitrate/live aggregates equal a scan of destinations"""
+        streamer = _streamer(StreamPlatform.YOUTUBE, StreamPlatform.TWITCH)
+        streamer.destinations[1].config.quality = StreamQuality.MEDIUM
+
+        await streamer.start_streaming()
+        await _real_sleep(0.05)
+
+        live = streamer.get_live_destinations()
+        stats = streamer.get_statistics()
+        assert stats["live_destinations"] == len(live) == 2
+        assert streamer.get_average_bitrate() == pytest.approx(
+            sum(d.metrics.bitrate_kbps for d in live) / len(live)
+        )
+        assert stats["destinations"]["youtube"]["status"] == "live"
+        assert set(stats["destinations"]["youtube"]["latency_ms"]) == {"p50", "p95", "p99"}
+
+        streamer.remove_destination(StreamPlatform.TWITCH)
+        assert streamer.get_average_bitrate() == pytest.approx(6000)
+
+        await streamer.stop_streaming()
+        assert streamer.get_average_bitrate() == 0.0
+        assert all(d.metrics.status == StreamStatus.STOPPED for d in streamer.destinations)
+
+    @pytest.mark.asyncio
+    async def test_retry_until_connected(self, fast_connect):
+        """Test failed connects are retried in a loop and streaming starts once"""
+        fast_connect["remaining"] = 2
+        streamer = _streamer(StreamPlatform.YOUTUBE, retry_delay_seconds=0)
+
+        await streamer.start_streaming()
+
+        destination = streamer.destinations[0]
+        assert destination.metrics.status == StreamStatus.LIVE
+        assert destination.retry_count == 2
+        assert len(streamer._ticking) == 1
+        await streamer.stop_streaming()
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted_leaves_error(self, fast_connect):
+        """Test a destination that never connects ends in ERROR"""
+        fast_connect["remaining"] = 10
+        streamer = _streamer(StreamPlatform.YOUTUBE, retry_delay_seconds=0, max_retry_attempts=2)
+
+        await streamer.start_streaming()
+
+        destination = streamer.destinations[0]
+        assert destination.metrics.status == StreamStatus.ERROR
+        assert destination.retry_count == 2
+        assert not streamer._ticking
+        await streamer.stop_streaming()
+
+    @pytest.mark.asyncio
+    async def test_failed_start_rolls_back(self, fast_connect):
+        """Test an escaping error resets the streamer so it can start again"""
+        streamer = _streamer(StreamPlatform.YOUTUBE, StreamPlatform.TWITCH)
+        register = streamer._stream_to_destination
+
+        def broken(destination):
+            if destination.config.platform is StreamPlatform.TWITCH:
+                raise KeyError("encoder missing")
+            register(destination)
+
+        streamer._stream_to_destination = broken
+        with pytest.raises(ExceptionGroup):
+            await streamer.start_streaming()
+
+        assert not streamer.is_streaming
+        assert streamer._monitor_task is None
+        assert not streamer.get_live_destinations()
+
+        streamer._stream_to_destination = register
+        await streamer.start_streaming()
+        assert len(streamer.get_live_destinations()) == 2
+        await streamer.stop_streaming()
@@ -0,0 +1,166 @@
+"""
+Unit tests for the swarm task decomposer
+
+Author: AI Council System
+Version: 2.0.0
+"""
+
+import random
+
+import pytest
+from swarm.orchestrator.task_decomposer import (
+    Task,
+    TaskDecomposer,
+    TaskDependency,
+    TaskPriority,
+    TaskType,
+)
+
+
+def _task(task_id: str, effort: int, blockers=()) -> Task:
+    return Task(
+        task_id=task_id,
+        title=task_id,
+        description=task_id,
+        task_type=TaskType.DEVELOPMENT,
+        priority=TaskPriority.MEDIUM,
+        estimated_effort=effort,
+        required_capabilities=[],
+        dependencies=[TaskDependency(blocker, "blocks") for blocker in blockers],
+        acceptance_criteria=[],
+        metadata={}
+    )
+
+
+def _random_dag(rng: random.Random, size: int):
+    """Tasks whose blockers are drawn from earlier tasks, in shuffled order"""
+    tasks = []
+    for i in range(size):
+        blockers = rng.sample([t.task_id for t in tasks], k=min(len(tasks), rng.randrange(0, 3)))
+        tasks.append(_task(f"t{i}", rng.randrange(1, 9), blockers))
+    rng.shuffle(tasks)
+    return tasks
+
+
+def _reference_execution_order(subtasks):
+    """The original repeated-scan batching"""
+    completed = set()
+    order = []
+    while len(completed) < len(subtasks):
+        batch = [t.task_id for t in subtasks if t.task_id not in completed and t.is_ready(completed)]
+        if not batch:
+            break
+        order.append(batch)
+        completed.update(batch)
+    return order
+
+
+def _longest_path_effort(subtasks):
+    """Effort of the heaviest blocker chain, by memoized recursion"""
+    by_id = {t.task_id: t for t in subtasks}
+    memo = {}
+
+    def finish(task_id):
+        if task_id not in memo:
+            task = by_id[task_id]
+            memo[task_id] = task.estimated_effort + max(
+                (finish(dep.task_id) for dep in task.dependencies), default=0
+            )
+        return memo[task_id]
+
+    return max(finish(t.task_id) for t in subtasks)
+
+
+class TestExecutionPlan:
+    """Test the fused topological pass against the original algorithms"""
+
+    def test_batches_match_original_on_random_dags(self):
+        """Test execution batches equal the original repeated scan"""
+        rng = random.Random(42)
+        decomposer = TaskDecomposer()
+
+        for _ in range(200):
+            subtasks = _random_dag(rng, rng.randrange(1, 15))
+            order, _, total, _ = decomposer._build_execution_order(subtasks)
+
+            expected = _reference_execution_order(subtasks)
+            assert [sorted(batch) for batch in order] == [sorted(batch) for batch in expected]
+            assert total == sum(t.estimated_effort for t in subtasks)
+
+    def test_critical_path_is_heaviest_chain(self):
+        """Test the critical path is a blocker chain of maximum total effort"""
+        rng = random.Random(7)
+        decomposer = TaskDecomposer()
+
+        for _ in range(200):
+            subtasks = _random_dag(rng, rng.randrange(1, 15))
+            _, path, _, children = decomposer._build_execution_order(subtasks)
+            by_id = {t.task_id: t for t in subtasks}
+
+            for blocker, blocked in zip(path, path[1:]):
+                assert blocked in children[blocker]
+            assert not by_id[path[0]].dependencies
+            assert sum(by_id[i].estimated_effort for i in path) == _longest_path_effort(subtasks)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("task_type", list(TaskType))
+    async def test_phase_chains_match_original(self, task_type):
+        """Test built-in strategies keep the original one-task batches and path"""
+        result = await TaskDecomposer().decompose_task("Ship it", task_type)
+        ids = [t.task_id for t in result.subtasks]
+
+        assert result.execution_order == _reference_execution_order(result.subtasks)
+        assert result.execution_order == [[task_id] for task_id in ids]
+        assert result.critical_path == ids
+        assert result.estimated_total_effort == sum(t.estimated_effort for t in result.subtasks)
+
+    def test_cycle_leaves_tasks_unscheduled(self):
+        """Test tasks on a cycle are dropped from the plan, as before"""
+        subtasks = [_task("a", 1), _task("b", 2, ["a", "c"]), _task("c", 3, ["b"])]
+        order, _, _, _ = TaskDecomposer()._build_execution_order(subtasks)
+
+        assert order == _reference_execution_order(subtasks) == [["a"]]
+
+
+class TestResultCache:
+    """Test opt-in memoization of decomposition results"""
+
+    @pytest.mark.asyncio
+    async def test_cache_off_by_default_issues_fresh_ids(self):
+        """Test repeated requests get new task IDs without a cache"""
+        decomposer = TaskDecomposer()
+        first = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT)
+        second = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT)
+
+        assert not {t.task_id for t in first.subtasks} & {t.task_id for t in second.subtasks}
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_independent_copy(self):
+        """Test a hit repeats the first IDs but shares no mutable state"""
+        decomposer = TaskDecomposer(cache_size=4)
+        first = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT, {"team": "a"})
+        first.subtasks[0].metadata["touched"] = True
+        first.critical_path.clear()
+
+        second = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT, {"team": "a"})
+
+        assert [t.task_id for t in second.subtasks] == [t.task_id for t in first.subtasks]
+        assert "touched" not in second.subtasks[0].metadata
+        assert second.critical_path
+
+    @pytest.mark.asyncio
+    async def test_cache_keys_and_eviction(self):
+        """Test context is part of the key, unhashable context bypasses, and LRU eviction"""
+        decomposer = TaskDecomposer(cache_size=1)
+        a = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT, {"team": "a"})
+        b = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT, {"team": "b"})
+        assert a.subtasks[0].task_id != b.subtasks[0].task_id
+
+        # {"team": "a"} was evicted by {"team": "b"}
+        again = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT, {"team": "a"})
+        assert again.subtasks[0].task_id not in (a.subtasks[0].task_id, b.subtasks[0].task_id)
+
+        unhashable = {"tags": ["x"]}
+        u1 = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT, unhashable)
+        u2 = await decomposer.decompose_task("Build API", TaskType.DEVELOPMENT, unhashable)
+        assert u1.subtasks[0].task_id != u2.subtasks[0].task_id